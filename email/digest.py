@@ -5,173 +5,78 @@ import json
 import os
 import smtplib
 from datetime import datetime, timedelta
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.message import EmailMessage
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterable, Iterator, Optional, List, Tuple
+
+from jinja2 import Environment
+from markupsafe import Markup
+
+try:
+    import ijson
+except ImportError:  # optional; without it the whole file is loaded at once
+    ijson = None
 
 # Load .env file if present
 SCRIPT_DIR = Path(__file__).parent
 ENV_FILE = SCRIPT_DIR.parent / ".env"
 if ENV_FILE.exists():
-    with open(ENV_FILE) as f:
-        for line in f:
+    try:
+        from dotenv import load_dotenv
+        load_dotenv(ENV_FILE)
+    except ImportError:
+        for line in ENV_FILE.read_text().splitlines():
             line = line.strip()
-            if line and not line.startswith("#") and "=" in line:
-                key, value = line.split("=", 1)
-                os.environ.setdefault(key.strip(), value.strip())
+            if line and not line.startswith("#"):
+                key, sep, value = line.partition("=")
+                if sep:
+                    os.environ.setdefault(key.strip(), value.strip())
 
 # Paths
 DATA_DIR = SCRIPT_DIR.parent / "data"
 OPPORTUNITIES_FILE = DATA_DIR / "opportunities.json"
-
-
-def load_opportunities() -> List[dict]:
-    """Load opportunities from JSON file."""
-    if OPPORTUNITIES_FILE.exists():
-        with open(OPPORTUNITIES_FILE) as f:
-            return json.load(f)
-    return []
-
-
-def parse_deadline(deadline_str: Optional[str]) -> Optional[datetime]:
-    """Try to parse a deadline string into a datetime."""
-    if not deadline_str:
-        return None
-    from dateutil import parser
-    try:
-        return parser.parse(deadline_str, fuzzy=True)
-    except (ValueError, TypeError):
-        return None
-
-
-def get_closing_soon(opportunities: List[dict], days: int = 14) -> List[dict]:
-    """Get opportunities closing within the next N days."""
-    cutoff = datetime.now() + timedelta(days=days)
-    closing = []
-
-    for opp in opportunities:
-        deadline = parse_deadline(opp.get("deadline"))
-        if deadline and datetime.now() < deadline <= cutoff:
-            opp["_parsed_deadline"] = deadline
-            closing.append(opp)
-
-    return sorted(closing, key=lambda x: x["_parsed_deadline"])
-
-
-def get_new_opportunities(opportunities: List[dict], days: int = 14) -> List[dict]:
-    """Get opportunities scraped within the last N days."""
-    cutoff = datetime.now() - timedelta(days=days)
-    new_opps = []
-
-    for opp in opportunities:
-        scraped_at = opp.get("scraped_at")
-        if scraped_at:
-            try:
-                scraped_date = datetime.fromisoformat(scraped_at.replace("Z", "+00:00"))
-                if scraped_date.replace(tzinfo=None) >= cutoff:
-                    new_opps.append(opp)
-            except (ValueError, TypeError):
-                pass
-
-    return new_opps
-
-
-def format_opportunity_html(opp: dict, is_closing_soon: bool = False) -> str:
-    """Format a single opportunity as HTML."""
-    title = opp.get("title", "Untitled")
-    url = opp.get("url", "#")
-    source = opp.get("source", "Unknown")
-    opp_type = opp.get("type", "").upper()
-    deadline = opp.get("deadline")
-    funding = opp.get("funding_size", "")
-    description = opp.get("description", "")[:200]
-    if len(opp.get("description", "")) > 200:
-        description += "..."
-    eligibility = opp.get("eligibility", "")
-
-    # Card background for closing soon items
-    card_bg = "#FBF5F2" if is_closing_soon else "#FFFFFF"
-
-    # Build details line
-    details_parts = []
-    if funding:
-        details_parts.append(f'<span style="font-weight: 600; color: #1A1A1A;">{funding}</span>')
-    if deadline:
-        deadline_color = "#C26E4B" if is_closing_soon else "#6C6863"
-        deadline_weight = "500" if is_closing_soon else "400"
-        details_parts.append(f'<span style="color: {deadline_color}; font-weight: {deadline_weight};">Deadline: {deadline}</span>')
-    details_html = " &nbsp;&middot;&nbsp; ".join(details_parts) if details_parts else ""
-
-    # Badge for closing soon
-    badge_html = ""
-    if is_closing_soon:
-        badge_html = '<span style="display: inline-block; padding: 4px 8px; margin-bottom: 12px; font-size: 10px; font-weight: 600; letter-spacing: 0.1em; text-transform: uppercase; background-color: #C26E4B; color: white; border-radius: 3px;">CLOSING SOON</span><br>'
-
-    # Meta line (source and type)
-    meta_parts = [f'<span style="color: #6C6863;">{source}</span>']
-    if opp_type:
-        meta_parts.append(f'<span>{opp_type}</span>')
-    meta_html = " &nbsp;&middot;&nbsp; ".join(meta_parts)
-
-    # Eligibility
-    eligibility_html = ""
-    if eligibility:
-        eligibility_html = f'<p style="margin: 8px 0 0 0; font-size: 13px; line-height: 1.5; color: #9A9590;"><span style="font-weight: 500; color: #6C6863;">Eligibility:</span> {eligibility}</p>'
-
-    return f"""
-    <div style="margin-bottom: 8px; padding: 24px; background-color: {card_bg}; border-radius: 3px;">
-        {badge_html}
+DIGEST_CACHE_FILE = DATA_DIR / ".digest_cache.html"
+
+# Gmail SMTP settings
+SMTP_HOST = "smtp.gmail.com"
+SMTP_PORT = 465
+# Reconnect after this many messages rather than holding one session open indefinitely
+MAX_MESSAGES_PER_CONNECTION = 100
+
+# Deadline formats tried before falling back to dateutil's fuzzy parser
+DEADLINE_FORMATS = ("%B %d, %Y", "%m/%d/%Y")
+
+# Email templates, compiled once at import. Autoescaping keeps scraped titles,
+# URLs and descriptions from breaking (or injecting into) the digest markup.
+TEMPLATE_ENV = Environment(autoescape=True, trim_blocks=True, lstrip_blocks=True)
+
+OPPORTUNITY_CARD_TEMPLATE = TEMPLATE_ENV.from_string("""
+    <div style="margin-bottom: 8px; padding: 24px; background-color: {{ '#FBF5F2' if is_closing_soon else '#FFFFFF' }}; border-radius: 3px;">
+        {% if is_closing_soon %}
+        <span style="display: inline-block; padding: 4px 8px; margin-bottom: 12px; font-size: 10px; font-weight: 600; letter-spacing: 0.1em; text-transform: uppercase; background-color: #C26E4B; color: white; border-radius: 3px;">CLOSING SOON</span><br>
+        {% endif %}
         <h3 style="margin: 0 0 8px 0; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; font-size: 16px; font-weight: 500; line-height: 1.4;">
-            <a href="{url}" style="color: #1A1A1A; text-decoration: none;">{title}</a>
+            <a href="{{ url }}" style="color: #1A1A1A; text-decoration: none;">{{ title }}</a>
         </h3>
-        <p style="margin: 0 0 8px 0; font-size: 14px;">{details_html}</p>
-        <p style="margin: 0; font-size: 11px; letter-spacing: 0.08em; text-transform: uppercase; color: #9A9590;">{meta_html}</p>
-        <p style="margin: 12px 0 0 0; font-size: 14px; line-height: 1.6; color: #6C6863;">{description}</p>
-        {eligibility_html}
+        <p style="margin: 0 0 8px 0; font-size: 14px;">
+            {%- if funding %}<span style="font-weight: 600; color: #1A1A1A;">{{ funding }}</span>{% endif %}
+            {%- if funding and deadline %} &nbsp;&middot;&nbsp; {% endif %}
+            {%- if deadline %}<span style="color: {{ '#C26E4B' if is_closing_soon else '#6C6863' }}; font-weight: {{ '500' if is_closing_soon else '400' }};">Deadline: {{ deadline }}</span>{% endif -%}
+        </p>
+        <p style="margin: 0; font-size: 11px; letter-spacing: 0.08em; text-transform: uppercase; color: #9A9590;"><span style="color: #6C6863;">{{ source }}</span>{% if opp_type %} &nbsp;&middot;&nbsp; <span>{{ opp_type }}</span>{% endif %}</p>
+        <p style="margin: 12px 0 0 0; font-size: 14px; line-height: 1.6; color: #6C6863;">{{ description }}</p>
+        {% if eligibility %}
+        <p style="margin: 8px 0 0 0; font-size: 13px; line-height: 1.5; color: #9A9590;"><span style="font-weight: 500; color: #6C6863;">Eligibility:</span> {{ eligibility }}</p>
+        {% endif %}
         <p style="margin: 12px 0 0 0;">
-            <a href="{url}" style="font-size: 12px; font-weight: 500; letter-spacing: 0.05em; text-transform: uppercase; color: #9A9590; text-decoration: none;">VIEW OPPORTUNITY →</a>
+            <a href="{{ url }}" style="font-size: 12px; font-weight: 500; letter-spacing: 0.05em; text-transform: uppercase; color: #9A9590; text-decoration: none;">VIEW OPPORTUNITY →</a>
         </p>
     </div>
-    """
-
+""")
 
-def generate_digest_html(closing_soon: List[dict], new_opps: List[dict], site_url: str) -> str:
-    """Generate the full email digest HTML."""
-    today = datetime.now().strftime("%B %d, %Y")
-
-    # Stats line
-    stats_parts = []
-    if closing_soon:
-        stats_parts.append(f"<strong style='color: #1A1A1A;'>{len(closing_soon)}</strong> CLOSING SOON")
-    stats_parts.append(f"<strong style='color: #1A1A1A;'>{len(new_opps)}</strong> NEW")
-    stats_html = " &nbsp;&nbsp;·&nbsp;&nbsp; ".join(stats_parts)
-
-    closing_html = ""
-    if closing_soon:
-        closing_html = """
-        <div style="margin-top: 32px; padding-top: 24px; border-top: 1px solid rgba(26, 26, 26, 0.1);">
-            <h2 style="margin: 0 0 20px 0; font-family: Georgia, serif; font-size: 18px; font-weight: 600; color: #C26E4B;">Closing Soon</h2>
-        """
-        for opp in closing_soon:
-            closing_html += format_opportunity_html(opp, is_closing_soon=True)
-        closing_html += "</div>"
-    else:
-        closing_html = '<p style="margin-top: 32px; color: #9A9590; font-style: italic;">No opportunities closing in the next 14 days.</p>'
-
-    new_html = ""
-    if new_opps:
-        new_html = """
-        <div style="margin-top: 32px; padding-top: 24px; border-top: 1px solid rgba(26, 26, 26, 0.1);">
-            <h2 style="margin: 0 0 20px 0; font-family: Georgia, serif; font-size: 18px; font-weight: 600; color: #1A1A1A;">New Opportunities</h2>
-        """
-        for opp in new_opps:
-            new_html += format_opportunity_html(opp, is_closing_soon=False)
-        new_html += "</div>"
-    else:
-        new_html = '<p style="margin-top: 32px; color: #9A9590; font-style: italic;">No new opportunities found since last digest.</p>'
-
-    return f"""
+DIGEST_TEMPLATE = TEMPLATE_ENV.from_string("""
     <!DOCTYPE html>
     <html>
     <head>
@@ -185,21 +90,35 @@ def generate_digest_html(closing_soon: List[dict], new_opps: List[dict], site_ur
                 <h1 style="margin: 0 0 8px 0; font-family: Georgia, 'Times New Roman', serif; font-size: 28px; font-weight: 600; letter-spacing: -0.025em; color: #1A1A1A;">
                     Fellowship & Grant Tracker
                 </h1>
-                <p style="margin: 0; font-size: 15px; color: #6C6863;">Biweekly digest for {today}</p>
+                <p style="margin: 0; font-size: 15px; color: #6C6863;">Biweekly digest for {{ today }}</p>
             </div>
 
             <!-- Stats -->
             <div style="text-align: center; padding: 16px 0; border-top: 1px solid rgba(26, 26, 26, 0.1); border-bottom: 1px solid rgba(26, 26, 26, 0.1); font-size: 12px; letter-spacing: 0.05em; text-transform: uppercase; color: #9A9590;">
-                {stats_html}
+                {% if closing_cards %}<strong style='color: #1A1A1A;'>{{ closing_cards|length }}</strong> CLOSING SOON &nbsp;&nbsp;·&nbsp;&nbsp; {% endif %}<strong style='color: #1A1A1A;'>{{ new_cards|length }}</strong> NEW
             </div>
 
-            {closing_html}
-
-            {new_html}
+            {% if closing_cards %}
+            <div style="margin-top: 32px; padding-top: 24px; border-top: 1px solid rgba(26, 26, 26, 0.1);">
+                <h2 style="margin: 0 0 20px 0; font-family: Georgia, serif; font-size: 18px; font-weight: 600; color: #C26E4B;">Closing Soon</h2>
+                {% for card in closing_cards %}{{ card }}{% endfor %}
+            </div>
+            {% else %}
+            <p style="margin-top: 32px; color: #9A9590; font-style: italic;">No opportunities closing in the next 14 days.</p>
+            {% endif %}
+
+            {% if new_cards %}
+            <div style="margin-top: 32px; padding-top: 24px; border-top: 1px solid rgba(26, 26, 26, 0.1);">
+                <h2 style="margin: 0 0 20px 0; font-family: Georgia, serif; font-size: 18px; font-weight: 600; color: #1A1A1A;">New Opportunities</h2>
+                {% for card in new_cards %}{{ card }}{% endfor %}
+            </div>
+            {% else %}
+            <p style="margin-top: 32px; color: #9A9590; font-style: italic;">No new opportunities found since last digest.</p>
+            {% endif %}
 
             <!-- CTA Button -->
             <div style="margin-top: 48px; padding-top: 32px; border-top: 1px solid rgba(26, 26, 26, 0.1); text-align: center;">
-                <a href="{site_url}" style="display: inline-block; padding: 14px 28px; background-color: #1A1A1A; color: #FFFFFF; font-size: 12px; font-weight: 500; letter-spacing: 0.05em; text-transform: uppercase; text-decoration: none; border-radius: 3px;">
+                <a href="{{ site_url }}" style="display: inline-block; padding: 14px 28px; background-color: #1A1A1A; color: #FFFFFF; font-size: 12px; font-weight: 500; letter-spacing: 0.05em; text-transform: uppercase; text-decoration: none; border-radius: 3px;">
                     View All Opportunities
                 </a>
             </div>
@@ -215,7 +134,187 @@ def generate_digest_html(closing_soon: List[dict], new_opps: List[dict], site_ur
         </div>
     </body>
     </html>
+""")
+
+# dateutil.parser, imported on first use so runs with only well-formed dates never load it
+_dateutil = None
+
+
+def iter_opportunities() -> Iterator[dict]:
+    """Yield opportunities from the JSON file one at a time."""
+    if not OPPORTUNITIES_FILE.exists():
+        return
+    with open(OPPORTUNITIES_FILE, "rb") as f:
+        if ijson:
+            yield from ijson.items(f, "item", use_float=True)
+        else:
+            yield from json.load(f)
+
+
+@lru_cache(maxsize=None)
+def parse_deadline(deadline_str: Optional[str]) -> Optional[datetime]:
+    """Try to parse a deadline string into a datetime."""
+    global _dateutil
+    if not deadline_str:
+        return None
+    # Fast paths first: ISO timestamps and the formats scrapers usually produce
+    try:
+        return datetime.fromisoformat(deadline_str.replace("Z", "+00:00"))
+    except (ValueError, TypeError, AttributeError):
+        pass
+    for fmt in DEADLINE_FORMATS:
+        try:
+            return datetime.strptime(deadline_str, fmt)
+        except (ValueError, TypeError):
+            pass
+
+    if _dateutil is None:
+        from dateutil import parser as _dateutil
+    try:
+        return _dateutil.parse(deadline_str, fuzzy=True)
+    except (ValueError, TypeError):
+        return None
+
+
+def partition_opportunities(opportunities: Iterable[dict], days: int = 14) -> Tuple[List[dict], List[dict]]:
+    """Split opportunities into (closing soon, new) in a single pass.
+
+    Closing soon: deadline within the next N days, sorted soonest first.
+    New: scraped within the last N days. An opportunity can be in both.
     """
+    now = datetime.now()
+    closing_cutoff = now + timedelta(days=days)
+    new_cutoff = now - timedelta(days=days)
+    closing = []
+    new_opps = []
+
+    for opp in opportunities:
+        deadline = parse_deadline(opp.get("deadline"))
+        if deadline and now < deadline <= closing_cutoff:
+            opp["_parsed_deadline"] = deadline
+            closing.append(opp)
+
+        scraped_at = opp.get("scraped_at")
+        if scraped_at:
+            try:
+                scraped_date = datetime.fromisoformat(scraped_at.replace("Z", "+00:00"))
+                if scraped_date.replace(tzinfo=None) >= new_cutoff:
+                    new_opps.append(opp)
+            except (ValueError, TypeError):
+                pass
+
+    closing.sort(key=itemgetter("_parsed_deadline"))
+    return closing, new_opps
+
+
+def safe_url(url: Optional[str]) -> str:
+    """Only link out to http(s) URLs; escaping alone doesn't neuter javascript: hrefs."""
+    if url and url.lstrip().lower().startswith(("http://", "https://")):
+        return url
+    return "#"
+
+
+def format_opportunity_html(opp: dict, is_closing_soon: bool = False) -> Markup:
+    """Format a single opportunity as HTML."""
+    # description_short is precomputed by the scraper; fall back for older data files
+    description = opp.get("description_short")
+    if description is None:
+        description = opp.get("description") or ""
+        if len(description) > 200:
+            description = description[:200] + "..."
+
+    return Markup(OPPORTUNITY_CARD_TEMPLATE.render(
+        is_closing_soon=is_closing_soon,
+        title=opp.get("title", "Untitled"),
+        url=safe_url(opp.get("url")),
+        source=opp.get("source", "Unknown"),
+        opp_type=opp.get("type", "").upper(),
+        deadline=opp.get("deadline"),
+        funding=opp.get("funding_size", ""),
+        description=description,
+        eligibility=opp.get("eligibility", ""),
+    ))
+
+
+def generate_digest_html(closing_soon: List[dict], new_opps: List[dict], site_url: str,
+                         today: Optional[str] = None) -> str:
+    """Generate the full email digest HTML."""
+    return DIGEST_TEMPLATE.render(
+        today=today or datetime.now().strftime("%B %d, %Y"),
+        closing_cards=[format_opportunity_html(opp, is_closing_soon=True) for opp in closing_soon],
+        new_cards=[format_opportunity_html(opp, is_closing_soon=False) for opp in new_opps],
+        site_url=site_url,
+    )
+
+
+def digest_cache_key(site_url: str, today: str) -> Optional[str]:
+    """Identify a rendered digest by the data file's mtime/size, the date and the site URL."""
+    if not OPPORTUNITIES_FILE.exists():
+        return None
+    stat = OPPORTUNITIES_FILE.stat()
+    return f"{stat.st_mtime_ns}-{stat.st_size}-{today}-{site_url}"
+
+
+def load_cached_digest(key: Optional[str]) -> Optional[str]:
+    """Return the cached digest HTML if it was rendered for this key."""
+    if not key or not DIGEST_CACHE_FILE.exists():
+        return None
+    header, _, html_content = DIGEST_CACHE_FILE.read_text().partition("\n")
+    return html_content if header == f"<!--{key}-->" else None
+
+
+def save_cached_digest(key: Optional[str], html_content: str) -> None:
+    """Cache rendered digest HTML, tagged with its key on the first line."""
+    if key:
+        DIGEST_CACHE_FILE.write_text(f"<!--{key}-->\n{html_content}")
+
+
+class SMTPSession:
+    """SMTP connection that logs in once and sends any number of messages.
+
+    Use as a context manager. Messages on the same connection are separated
+    with RSET; the connection is recycled every MAX_MESSAGES_PER_CONNECTION.
+    """
+
+    def __init__(self, username: str, password: str, host: str = SMTP_HOST, port: int = SMTP_PORT):
+        self.username = username
+        self.password = password
+        self.host = host
+        self.port = port
+        self._server = None
+        self._sent = 0
+
+    def __enter__(self) -> "SMTPSession":
+        self._connect()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _connect(self) -> None:
+        self._server = smtplib.SMTP_SSL(self.host, self.port)
+        self._server.login(self.username, self.password)
+        self._sent = 0
+
+    def close(self) -> None:
+        """Close the connection, ignoring errors from an already-dropped server."""
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except smtplib.SMTPException:
+            pass
+        self._server = None
+
+    def send(self, from_addr: str, to_addrs: List[str], message: EmailMessage) -> None:
+        """Send one message, reusing the open connection where possible."""
+        if self._sent >= MAX_MESSAGES_PER_CONNECTION:
+            self.close()
+            self._connect()
+        elif self._sent:
+            self._server.rset()
+        self._server.send_message(message, from_addr, to_addrs)
+        self._sent += 1
 
 
 def send_digest():
@@ -224,6 +323,8 @@ def send_digest():
     gmail_address = os.environ.get("GMAIL_ADDRESS")
     gmail_app_password = os.environ.get("GMAIL_APP_PASSWORD")
     site_url = os.environ.get("SITE_URL", "https://oshanjarow.github.io/fellowship-tracker")
+    # Comma-separated; defaults to sending to yourself
+    recipients = [r.strip() for r in os.environ.get("DIGEST_RECIPIENTS", "").split(",") if r.strip()]
 
     if not gmail_address:
         print("ERROR: GMAIL_ADDRESS not set")
@@ -233,37 +334,46 @@ def send_digest():
         print("ERROR: GMAIL_APP_PASSWORD not set")
         return False
 
-    # Load and process opportunities
-    opportunities = load_opportunities()
-    print(f"Loaded {len(opportunities)} opportunities")
+    if not recipients:
+        recipients = [gmail_address]
+
+    today = datetime.now().strftime("%B %d, %Y")
 
-    closing_soon = get_closing_soon(opportunities)
-    new_opps = get_new_opportunities(opportunities)
+    # Reuse today's rendered digest if the data hasn't changed (e.g. a retried send)
+    cache_key = digest_cache_key(site_url, today)
+    html_content = load_cached_digest(cache_key)
+    if html_content is not None:
+        print("Using cached digest; opportunities unchanged since it was rendered")
+    else:
+        # Stream opportunities straight into the closing-soon/new split
+        closing_soon, new_opps = partition_opportunities(iter_opportunities())
 
-    print(f"Closing soon: {len(closing_soon)}")
-    print(f"New opportunities: {len(new_opps)}")
+        print(f"Closing soon: {len(closing_soon)}")
+        print(f"New opportunities: {len(new_opps)}")
 
-    # Generate email
-    html_content = generate_digest_html(closing_soon, new_opps, site_url)
+        # Generate email
+        html_content = generate_digest_html(closing_soon, new_opps, site_url, today)
+        save_cached_digest(cache_key, html_content)
 
     # Create message
-    today = datetime.now().strftime("%B %d, %Y")
     subject = f"Fellowship & Grant Digest - {today}"
 
-    msg = MIMEMultipart("alternative")
+    msg = EmailMessage()
     msg["Subject"] = subject
     msg["From"] = gmail_address
-    msg["To"] = gmail_address  # Send to yourself
 
-    # Attach HTML content
-    msg.attach(MIMEText(html_content, "html"))
+    # Plain-text fallback plus the HTML digest as a multipart/alternative
+    msg.set_content(f"Your fellowship & grant digest for {today} is best viewed as HTML.\n\nBrowse all opportunities: {site_url}\n")
+    msg.add_alternative(html_content, subtype="html")
 
-    # Send via Gmail SMTP
+    # Send via Gmail SMTP, one connection for all recipients
     try:
-        with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-            server.login(gmail_address, gmail_app_password)
-            server.sendmail(gmail_address, gmail_address, msg.as_string())
-        print("Email sent successfully!")
+        with SMTPSession(gmail_address, gmail_app_password) as session:
+            for recipient in recipients:
+                del msg["To"]
+                msg["To"] = recipient
+                session.send(gmail_address, [recipient], msg)
+        print(f"Email sent successfully to {len(recipients)} recipient(s)!")
         return True
     except Exception as e:
         print(f"Error sending email: {e}")
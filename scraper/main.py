@@ -1,15 +1,25 @@
 #!/usr/bin/env python3
 """Main scraper orchestrator for fellowship/grant tracker."""
 
+import argparse
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional, Tuple, List
 
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib json module
+    orjson = None
+
 from sources import gijn, gfmd, fundsforwriters, rss_feeds, jschools, direct, discovery
+from sources._http import clear_cache
 from utils.dedup import deduplicate
-from utils.filter import filter_relevant
+from utils.filter import is_relevant
 from utils.scoring import add_relevance_scores
 
 # Paths
@@ -18,68 +28,168 @@ DATA_DIR = SCRIPT_DIR.parent / "data"
 OPPORTUNITIES_FILE = DATA_DIR / "opportunities.json"
 ARCHIVE_FILE = DATA_DIR / "archive.json"
 
+# Number of scrapers run concurrently
+SCRAPER_PARALLELISM = max(1, int(os.environ.get("SCRAPER_PARALLELISM", "8")))
+
+# Deadline formats tried before falling back to dateutil's fuzzy parser
+DEADLINE_FORMATS = ("%B %d, %Y", "%m/%d/%Y")
+
+# Length of the description_short field the email digest shows
+DESCRIPTION_SHORT_LENGTH = 200
+
+# dateutil.parser, imported on first use so runs with only well-formed dates never load it
+_dateutil = None
+
 
 def load_json(path: Path) -> list[dict]:
     """Load JSON file or return empty list."""
     if path.exists():
-        with open(path) as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson else json.loads(raw)
     return []
 
 
+def dump_json(data: list) -> bytes:
+    """Serialize data as indented JSON bytes."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str)
+    return json.dumps(data, indent=2, default=str).encode()
+
+
 def save_json(path: Path, data: list) -> None:
     """Save data to JSON file."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2, default=str)
-
-
+    path.write_bytes(dump_json(data))
+
+
+def append_json(path: Path, items: list) -> None:
+    """Append items to a JSON array file without reading the existing entries."""
+    if not items:
+        return
+    if not path.exists() or path.stat().st_size == 0:
+        save_json(path, items)
+        return
+
+    # Entries of the serialized list, already indented for the top-level array
+    entries = dump_json(items)[1:-1].strip(b"\n")
+
+    with open(path, "r+b") as f:
+        # Walk back past trailing whitespace to the closing bracket
+        pos = f.seek(0, os.SEEK_END)
+        char = b""
+        while pos > 0:
+            pos -= 1
+            f.seek(pos)
+            char = f.read(1)
+            if not char.isspace():
+                break
+        if char != b"]":
+            raise ValueError(f"{path} does not contain a JSON array")
+
+        # Back up to the last entry (or the opening bracket of an empty array)
+        while pos > 0:
+            pos -= 1
+            f.seek(pos)
+            char = f.read(1)
+            if not char.isspace():
+                break
+        separator = b"\n" if char == b"[" else b",\n"
+
+        f.seek(pos + 1)
+        f.truncate()
+        f.write(separator + entries + b"\n]")
+
+
+@lru_cache(maxsize=None)
 def parse_deadline(deadline_str: Optional[str]) -> Optional[datetime]:
     """Try to parse a deadline string into a datetime."""
+    global _dateutil
     if not deadline_str:
         return None
 
-    from dateutil import parser
+    # Fast paths first: ISO timestamps and the formats scrapers usually produce
+    try:
+        return datetime.fromisoformat(deadline_str.replace("Z", "+00:00"))
+    except (ValueError, TypeError, AttributeError):
+        pass
+    for fmt in DEADLINE_FORMATS:
+        try:
+            return datetime.strptime(deadline_str, fmt)
+        except (ValueError, TypeError):
+            pass
+
+    if _dateutil is None:
+        from dateutil import parser as _dateutil
     try:
-        return parser.parse(deadline_str, fuzzy=True)
+        return _dateutil.parse(deadline_str, fuzzy=True)
     except (ValueError, TypeError):
         return None
 
 
-def is_expired(opportunity: dict) -> bool:
-    """Check if an opportunity has expired."""
-    deadline = parse_deadline(opportunity.get("deadline"))
+def annotate_deadlines(opportunities: List[dict]) -> List[dict]:
+    """Parse each deadline once and stash it on the opportunity as _parsed_deadline."""
+    for opp in opportunities:
+        opp["_parsed_deadline"] = parse_deadline(opp.get("deadline"))
+    return opportunities
+
+
+def add_short_descriptions(opportunities: List[dict], limit: int = DESCRIPTION_SHORT_LENGTH) -> None:
+    """Precompute the truncated description the email digest displays."""
+    for opp in opportunities:
+        description = opp.get("description") or ""
+        opp["description_short"] = description[:limit] + "..." if len(description) > limit else description
+
+
+def strip_internal_fields(opportunities: List[dict]) -> None:
+    """Remove underscore-prefixed working fields before saving."""
+    for opp in opportunities:
+        for key in [k for k in opp if k.startswith("_")]:
+            del opp[key]
+
+
+def is_expired(opportunity: dict, now: Optional[datetime] = None) -> bool:
+    """Check if an opportunity has expired (as of `now`, default current time)."""
+    if "_parsed_deadline" in opportunity:
+        deadline = opportunity["_parsed_deadline"]
+    else:
+        deadline = parse_deadline(opportunity.get("deadline"))
     if deadline:
-        return deadline < datetime.now()
+        return deadline < (now or datetime.now())
     return False
 
 
-def archive_expired(opportunities: List[dict], archive: List[dict]) -> Tuple[List[dict], List[dict]]:
-    """Move expired opportunities to archive."""
+def archive_expired(opportunities: List[dict]) -> Tuple[List[dict], List[dict]]:
+    """Split out expired opportunities, returning (active, newly archived)."""
     active = []
     newly_archived = []
+    now = datetime.now()
+    archived_at = datetime.utcnow().isoformat()
 
     for opp in opportunities:
-        if is_expired(opp):
-            opp["archived_at"] = datetime.utcnow().isoformat()
+        if is_expired(opp, now):
+            opp["archived_at"] = archived_at
             newly_archived.append(opp)
         else:
             active.append(opp)
 
-    return active, archive + newly_archived
+    return active, newly_archived
 
 
-def main():
+def main(no_cache: bool = False):
     """Run all scrapers and update data files."""
     print("=" * 60)
     print(f"Fellowship & Grant Tracker - Scrape Run")
     print(f"Started: {datetime.utcnow().isoformat()}")
     print("=" * 60)
 
+    if no_cache:
+        clear_cache()
+        print("Cleared HTTP cache")
+
     # Load existing data
     existing = load_json(OPPORTUNITIES_FILE)
-    archive = load_json(ARCHIVE_FILE)
-    print(f"\nLoaded {len(existing)} existing opportunities, {len(archive)} archived")
+    print(f"\nLoaded {len(existing)} existing opportunities")
 
     # Run all scrapers
     all_scraped = []
@@ -102,52 +212,61 @@ def main():
     except Exception as e:
         print(f"[Discovery] ERROR: {e}")
 
-    for name, scraper in scrapers:
-        print(f"\n[{name}] Scraping...")
-        try:
-            results = scraper()
-            print(f"[{name}] Found {len(results)} items")
-            all_scraped.extend(results)
-        except Exception as e:
-            print(f"[{name}] ERROR: {e}")
+    # Scrapers are network-bound, so run them concurrently
+    # (SCRAPER_PARALLELISM=1 runs them one at a time for debugging)
+    results_by_name = {}
+    with ThreadPoolExecutor(max_workers=SCRAPER_PARALLELISM) as executor:
+        futures = {}
+        for name, scraper in scrapers:
+            print(f"\n[{name}] Scraping...")
+            futures[executor.submit(scraper)] = name
+
+        for future in as_completed(futures):
+            name = futures[future]
+            error = future.exception()
+            if error:
+                print(f"[{name}] ERROR: {error}")
+                continue
+            results_by_name[name] = future.result()
+            print(f"[{name}] Found {len(results_by_name[name])} items")
+
+    # Keep source order stable so deduplication is deterministic
+    for name, _ in scrapers:
+        all_scraped.extend(results_by_name.get(name, []))
 
     print(f"\n{'=' * 60}")
     print(f"Total scraped: {len(all_scraped)}")
 
-    # Filter for relevance
-    relevant = filter_relevant(all_scraped)
-    print(f"After relevance filter: {len(relevant)}")
-
-    # Deduplicate against existing
+    # Filter for relevance and deduplicate against existing in a single pass
+    relevant = (opp for opp in all_scraped if is_relevant(opp))
     new_opps = deduplicate(relevant, existing)
-    print(f"New unique opportunities: {len(new_opps)}")
+    print(f"New unique relevant opportunities: {len(new_opps)}")
 
     # Merge with existing
-    merged = existing + new_opps
+    merged = annotate_deadlines(existing + new_opps)
 
     # Archive expired
-    active, updated_archive = archive_expired(merged, archive)
+    active, newly_archived = archive_expired(merged)
     print(f"Active opportunities: {len(active)}")
-    print(f"Total archived: {len(updated_archive)}")
+    print(f"Newly archived: {len(newly_archived)}")
 
     # Add relevance scores based on user interests
     active = add_relevance_scores(active)
+    add_short_descriptions(active)
 
-    # Sort by relevance score (high first), then by deadline (soon first)
-    def sort_key(opp):
-        score = opp.get("relevance_score", 0)
-        deadline = parse_deadline(opp.get("deadline"))
-        # Primary: negative score (so higher scores come first)
-        # Secondary: deadline (None deadlines at end)
-        if deadline:
-            return (-score, 0, deadline)
-        return (-score, 1, datetime.max)
-
-    active.sort(key=sort_key)
+    # Sort by relevance score (high first), then by deadline (soon first,
+    # None deadlines at end). Keys are precomputed so the sort runs in C.
+    for opp in active:
+        deadline = opp["_parsed_deadline"]
+        opp["_sort_key"] = (-opp.get("relevance_score", 0), 0 if deadline else 1, deadline or datetime.max)
+    active.sort(key=itemgetter("_sort_key"))
 
     # Save updated data
+    strip_internal_fields(active)
+    strip_internal_fields(newly_archived)
     save_json(OPPORTUNITIES_FILE, active)
-    save_json(ARCHIVE_FILE, updated_archive)
+    # The archive only ever grows, so append instead of rewriting it
+    append_json(ARCHIVE_FILE, newly_archived)
 
     print(f"\n{'=' * 60}")
     print(f"Completed: {datetime.utcnow().isoformat()}")
@@ -165,4 +284,6 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Scrape fellowship and grant opportunities.")
+    parser.add_argument("--no-cache", action="store_true", help="clear the HTTP cache and re-download every page")
+    main(no_cache=parser.parse_args().no_cache)
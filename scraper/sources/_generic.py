@@ -0,0 +1,81 @@
+"""Shared scaffolding for listing-page scrapers (GIJN, FundsForWriters, GFMD)."""
+
+import requests
+import soupsieve
+from bs4 import BeautifulSoup
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, List, Optional
+from datetime import datetime, timezone
+
+from ._http import get
+
+
+@dataclass(frozen=True)
+class SourceConfig:
+    """Where a listing page lives and how to pull opportunities out of it."""
+    name: str
+    url: str
+    listing_selector: str
+    title_selector: str
+    type_label: str
+    link_selector: str = "a[href]"
+    desc_selector: Optional[str] = None
+    # Turns the raw title text into opportunity fields overriding the defaults
+    # (used where the title element concatenates title and metadata)
+    text_parser: Optional[Callable[[str], dict]] = None
+
+
+@lru_cache(maxsize=None)
+def _compiled(selector: str) -> soupsieve.SoupSieve:
+    """Parse a CSS selector once; reused for every listing and every run."""
+    return soupsieve.compile(selector)
+
+
+def scrape_listings(config: SourceConfig) -> List[dict]:
+    """Fetch a listing page and return one opportunity per listing element."""
+    opportunities = []
+
+    try:
+        response = get(config.url)
+        response.raise_for_status()
+        soup = BeautifulSoup(response.content, "lxml")
+        scraped_at = datetime.now(timezone.utc).isoformat()
+
+        title_sel = _compiled(config.title_selector)
+        link_sel = _compiled(config.link_selector)
+        desc_sel = _compiled(config.desc_selector) if config.desc_selector else None
+
+        for listing in _compiled(config.listing_selector).select(soup):
+            title_elem = title_sel.select_one(listing)
+            if not title_elem:
+                continue
+
+            title = title_elem.get_text(strip=True)
+            if not title:
+                continue
+
+            link_elem = link_sel.select_one(listing)
+            desc_elem = desc_sel.select_one(listing) if desc_sel else None
+
+            opp = {
+                "title": title,
+                "url": link_elem.get("href", "") if link_elem else "",
+                "description": desc_elem.get_text(strip=True) if desc_elem else "",
+                "source": config.name,
+                "source_url": config.url,
+                "type": config.type_label,
+                "scraped_at": scraped_at,
+                "deadline": None,
+            }
+            if config.text_parser:
+                opp.update(config.text_parser(title))
+                if not opp["title"]:
+                    continue
+
+            opportunities.append(opp)
+
+    except requests.RequestException as e:
+        print(f"Error scraping {config.name}: {e}")
+
+    return opportunities
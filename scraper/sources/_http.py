@@ -0,0 +1,165 @@
+"""Shared HTTP session for the source scrapers."""
+
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import timedelta
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from requests_cache import CachedSession
+except ImportError:  # optional; without it every run re-downloads each page
+    CachedSession = None
+
+# Headers sent with every request
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Default request timeout in seconds
+DEFAULT_TIMEOUT = 30
+
+# Default cap on bytes read by get_capped()
+MAX_PAGE_BYTES = 1024 * 1024
+
+# Requests sent to any one host per second (cache hits don't count)
+MAX_RPS_PER_HOST = 4
+
+# Longest Retry-After (seconds) honoured on 429/503 before retrying
+MAX_RETRY_AFTER = 60
+
+# On-disk HTTP cache shared by all scrapers (requires requests-cache)
+CACHE_FILE = Path(__file__).parent.parent.parent / ".cache" / "http_cache"
+CACHE_EXPIRE_AFTER = timedelta(hours=1)
+
+# Send times of the last MAX_RPS_PER_HOST requests per host (sliding window)
+_host_requests = defaultdict(deque)
+_throttle_lock = threading.Lock()
+
+
+def _throttle(url: str) -> None:
+    """Block until another request to url's host fits within MAX_RPS_PER_HOST."""
+    host = urlparse(url).netloc
+    while True:
+        with _throttle_lock:
+            now = time.monotonic()
+            window = _host_requests[host]
+            while window and now - window[0] >= 1.0:
+                window.popleft()
+            if len(window) < MAX_RPS_PER_HOST:
+                window.append(now)
+                return
+            wait = 1.0 - (now - window[0])
+        time.sleep(wait)
+
+
+class _ThrottledAdapter(HTTPAdapter):
+    """HTTPAdapter that paces requests per host.
+
+    Throttling at the adapter means only requests that actually go to the
+    network are paced; responses served from the cache never reach it.
+    """
+
+    def send(self, request, **kwargs):
+        _throttle(request.url)
+        return super().send(request, **kwargs)
+
+
+class _Retry(Retry):
+    """Retry that caps the server's Retry-After at MAX_RETRY_AFTER."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+
+# One pooled session so keep-alive connections (and TLS sessions) are reused
+# across requests and scrapers. With requests-cache installed, pages fetched
+# within CACHE_EXPIRE_AFTER are served from disk, and stale ones are
+# revalidated via ETag/Last-Modified where the server supports it.
+if CachedSession:
+    SESSION = CachedSession(
+        str(CACHE_FILE),
+        backend="sqlite",
+        expire_after=CACHE_EXPIRE_AFTER,
+        allowable_methods=("GET",),
+        cache_control=True,
+        stale_if_error=True,
+    )
+else:
+    SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+# 429/5xx responses are retried with exponential backoff, waiting for
+# Retry-After where the server sends one
+_ADAPTER = _ThrottledAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=_Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]),
+)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
+
+
+def clear_cache() -> None:
+    """Drop all cached responses so the next requests go to the network."""
+    if CachedSession:
+        SESSION.cache.clear()
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """GET a URL through the shared session with the default timeout."""
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    return SESSION.get(url, **kwargs)
+
+
+def read_capped(response: requests.Response, max_bytes: int = MAX_PAGE_BYTES) -> bytes:
+    """Read a streamed response body, stopping after about max_bytes."""
+    chunks = []
+    total = 0
+    for chunk in response.iter_content(65536):
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= max_bytes:
+            break
+    return b"".join(chunks)
+
+
+def get_capped(url: str, max_bytes: int = MAX_PAGE_BYTES, **kwargs) -> bytes:
+    """GET a URL, raising on HTTP errors, and return at most ~max_bytes of its body.
+
+    The body is streamed, so oversized pages are never downloaded or parsed in full.
+    """
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    with SESSION.get(url, stream=True, **kwargs) as response:
+        response.raise_for_status()
+        return read_capped(response, max_bytes)
+
+
+def get_html(url: str, max_bytes: int = MAX_PAGE_BYTES, max_content_length: Optional[int] = None,
+             **kwargs) -> Optional[bytes]:
+    """Like get_capped(), but return None without reading the body when the
+    response isn't HTML or declares a Content-Length above max_content_length.
+
+    The check uses the GET's own headers, so it costs no extra round trip.
+    """
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    with SESSION.get(url, stream=True, **kwargs) as response:
+        response.raise_for_status()
+        content_type = response.headers.get("Content-Type", "").lower()
+        if content_type and "html" not in content_type:
+            return None
+        if max_content_length is not None:
+            try:
+                if int(response.headers.get("Content-Length", "0")) > max_content_length:
+                    return None
+            except ValueError:
+                pass
+        return read_capped(response, max_bytes)
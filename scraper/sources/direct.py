@@ -1,70 +1,129 @@
 """Direct page scrapers for specific organizations."""
 
+import logging
 import re
 import requests
-from bs4 import BeautifulSoup
-from typing import List, Optional
-from datetime import datetime
-
-DIRECT_SOURCES = [
-    {
-        "name": "NEA Creative Writing Fellowships",
-        "url": "https://www.arts.gov/grants/creative-writing-fellowships",
-        "type": "fellowship"
-    },
-    {
-        "name": "Whiting Foundation",
-        "url": "https://www.whiting.org/writers/creative-nonfiction-grant",
-        "type": "grant"
-    },
-    {
-        "name": "Fund for Investigative Journalism",
-        "url": "https://fij.org/grants/",
-        "type": "grant"
-    },
-    {
-        "name": "PEN America Literary Awards",
-        "url": "https://pen.org/literary-awards/",
-        "type": "award"
-    },
+from concurrent.futures import ThreadPoolExecutor
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from datetime import datetime, timezone
+
+from ._http import get_capped
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class Source:
+    """A directly scraped page; known_* values are used instead of scraping those fields."""
+    name: str
+    url: str
+    type: str
+    known_amount: Optional[str] = None
+    known_description: Optional[str] = None
+    known_deadline: Optional[str] = None
+    known_eligibility: Optional[str] = None
+    bypass_filter: bool = False
+
+
+DIRECT_SOURCES: Tuple[Source, ...] = (
+    Source(
+        name="NEA Creative Writing Fellowships",
+        url="https://www.arts.gov/grants/creative-writing-fellowships",
+        type="fellowship",
+    ),
+    Source(
+        name="Whiting Foundation",
+        url="https://www.whiting.org/writers/creative-nonfiction-grant",
+        type="grant",
+    ),
+    Source(
+        name="Fund for Investigative Journalism",
+        url="https://fij.org/grants/",
+        type="grant",
+    ),
+    Source(
+        name="PEN America Literary Awards",
+        url="https://pen.org/literary-awards/",
+        type="award",
+    ),
     # General-purpose grants that can fund journalism/nonfiction projects
-    {
-        "name": "Emergent Ventures",
-        "url": "https://www.mercatus.org/emergent-ventures",
-        "type": "grant",
-        "known_amount": "$1,000 - $50,000",
-        "known_description": "Fast grants for ideas that improve society. Funds ambitious projects including journalism, media, research, and writing. Rolling applications, no restrictions on profit-making.",
-        "known_eligibility": "Open globally to anyone 13+. No citizenship or residency requirements.",
-        "bypass_filter": True,
-    },
-    {
-        "name": "ACX Grants",
-        "url": "https://www.astralcodexten.com/p/apply-for-an-acx-grant-2025",
-        "type": "grant",
-        "known_amount": "$5,000 - $100,000",
-        "known_description": "Annual grants from Scott Alexander's Astral Codex Ten for diverse projects including research, writing, and creative ventures. Funded 42 projects in 2025 round.",
-        "known_eligibility": "Open to anyone with a compelling project idea.",
-        "bypass_filter": True,
-    },
-    {
-        "name": "1517 Fund Medici Grant",
-        "url": "https://www.1517fund.com/",
-        "type": "grant",
-        "known_amount": "$1,000 - $100,000",
-        "known_description": "Micro-grants and R&D funding for early-stage builders and researchers. Supports experimental projects, writing, and ideas outside traditional institutions.",
-        "known_eligibility": "Open to young builders, researchers, and creators globally.",
-        "bypass_filter": True,
-    },
-    {
-        "name": "Awesome Foundation",
-        "url": "https://www.awesomefoundation.org/en",
-        "type": "grant",
-        "known_amount": "$1,000",
-        "known_description": "Monthly micro-grants for 'awesome' projects with no strings attached. 80+ local chapters worldwide funding arts, technology, community, and creative projects.",
-        "known_eligibility": "Anyone can apply - individuals, groups, or organizations.",
-        "bypass_filter": True,
-    },
-]
+    Source(
+        name="Emergent Ventures",
+        url="https://www.mercatus.org/emergent-ventures",
+        type="grant",
+        known_amount="$1,000 - $50,000",
+        known_description="Fast grants for ideas that improve society. Funds ambitious projects including journalism, media, research, and writing. Rolling applications, no restrictions on profit-making.",
+        known_eligibility="Open globally to anyone 13+. No citizenship or residency requirements.",
+        bypass_filter=True,
+    ),
+    Source(
+        name="ACX Grants",
+        url="https://www.astralcodexten.com/p/apply-for-an-acx-grant-2025",
+        type="grant",
+        known_amount="$5,000 - $100,000",
+        known_description="Annual grants from Scott Alexander's Astral Codex Ten for diverse projects including research, writing, and creative ventures. Funded 42 projects in 2025 round.",
+        known_eligibility="Open to anyone with a compelling project idea.",
+        bypass_filter=True,
+    ),
+    Source(
+        name="1517 Fund Medici Grant",
+        url="https://www.1517fund.com/",
+        type="grant",
+        known_amount="$1,000 - $100,000",
+        known_description="Micro-grants and R&D funding for early-stage builders and researchers. Supports experimental projects, writing, and ideas outside traditional institutions.",
+        known_eligibility="Open to young builders, researchers, and creators globally.",
+        bypass_filter=True,
+    ),
+    Source(
+        name="Awesome Foundation",
+        url="https://www.awesomefoundation.org/en",
+        type="grant",
+        known_amount="$1,000",
+        known_description="Monthly micro-grants for 'awesome' projects with no strings attached. 80+ local chapters worldwide funding arts, technology, community, and creative projects.",
+        known_eligibility="Anyone can apply - individuals, groups, or organizations.",
+        bypass_filter=True,
+    ),
+)
+
+# (connect, read) timeouts in seconds
+TIMEOUT = (5, 30)
+
+# Only build the <title> and <body> subtrees; the rest of <head> (inline
+# scripts, styles, JSON-LD) is never queried. The strainer only filters
+# top-level subtrees, so everything in <body> is still available to get_text.
+_STRAINER = SoupStrainer(["title", "body"])
+
+# Stop reading a page after this many bytes; title, intro and deadline are near the top
+MAX_PAGE_BYTES = 512 * 1024
+
+# Upper bound on concurrent page fetches
+MAX_WORKERS = 8
+
+
+# Funding amount patterns, each capturing the amount in its one group
+_FUNDING_PATTERNS = (
+    r'(?:receives?|award(?:ed)?|stipend|grant|fellowship)[^\$€£]*?([\$€£][\d,]+(?:\s*[-–]\s*[\$€£]?[\d,]+)?)',
+    r'([\$€£][\d,]+(?:\s*[-–]\s*[\$€£]?[\d,]+)?)\s*(?:fellowship|award|grant|stipend|prize)',
+    r'(up to\s*[\$€£][\d,]+)',
+    r'((?:USD|EUR|GBP)\s*[\d,]+(?:\s*[-–]\s*[\d,]+)?)',
+    r'(?:amount|funding|support|receive)[^\$€£]{0,30}([\$€£][\d,]+(?:\s*[-–]\s*[\$€£]?[\d,]+)?)',
+)
+
+# All funding patterns as one alternation, so the page text is scanned once.
+# The earliest match in the text wins; ties go to the earlier pattern.
+_FUNDING_RE = re.compile('|'.join(f'(?:{p})' for p in _FUNDING_PATTERNS), re.IGNORECASE)
+
+# Deadline patterns, matched case-insensitively against the page text
+_DEADLINE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r"deadline[:\s]+(\w+\s+\d{1,2},?\s+\d{4})",
+    r"applications?\s+due[:\s]+(\w+\s+\d{1,2},?\s+\d{4})",
+    r"closes?[:\s]+(\w+\s+\d{1,2},?\s+\d{4})",
+)]
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_AMOUNT_RE = re.compile(r'[\$€£]([\d,]+)')
 
 
 def extract_funding_amount(text: str) -> Optional[str]:
@@ -72,24 +131,15 @@ def extract_funding_amount(text: str) -> Optional[str]:
     if not text:
         return None
 
-    patterns = [
-        r'(?:receives?|award(?:ed)?|stipend|grant|fellowship)[^\$€£]*?([\$€£][\d,]+(?:\s*[-–]\s*[\$€£]?[\d,]+)?)',
-        r'([\$€£][\d,]+(?:\s*[-–]\s*[\$€£]?[\d,]+)?)\s*(?:fellowship|award|grant|stipend|prize)',
-        r'(up to\s*[\$€£][\d,]+)',
-        r'((?:USD|EUR|GBP)\s*[\d,]+(?:\s*[-–]\s*[\d,]+)?)',
-        r'(?:amount|funding|support|receive)[^\$€£]{0,30}([\$€£][\d,]+(?:\s*[-–]\s*[\$€£]?[\d,]+)?)',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            amount = match.group(1).strip()
-            amount = re.sub(r'\s+', ' ', amount)
-            return amount
-
-    # Fallback: find significant dollar amounts
-    amounts = re.findall(r'[\$€£]([\d,]+)', text)
-    for amt in amounts:
+    match = _FUNDING_RE.search(text)
+    if match:
+        amount = next(group for group in match.groups() if group is not None).strip()
+        amount = _WHITESPACE_RE.sub(' ', amount)
+        return amount
+
+    # Fallback: first significant dollar amount, scanning lazily
+    for amount_match in _AMOUNT_RE.finditer(text):
+        amt = amount_match.group(1)
         try:
             value = int(amt.replace(',', ''))
             if 1000 <= value <= 500000:
@@ -100,98 +150,126 @@ def extract_funding_amount(text: str) -> Optional[str]:
     return None
 
 
-def scrape() -> List[dict]:
-    """Scrape direct organization pages."""
-    opportunities = []
+def _is_title(tag: Tag) -> bool:
+    """soup.find() matcher equivalent to select_one("h1, .page-title, title"), minus soupsieve."""
+    return tag.name in ("h1", "title") or "page-title" in tag.get("class", ())
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
 
-    for source in DIRECT_SOURCES:
-        try:
-            response = requests.get(source["url"], timeout=30, headers=headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Get page title
-            title = soup.select_one("h1, .page-title, title")
-            title_text = title.get_text(strip=True) if title else source["name"]
-
-            # Clean up title from <title> tag
-            if " | " in title_text:
-                title_text = title_text.split(" | ")[0]
-            if " - " in title_text:
-                title_text = title_text.split(" - ")[0]
-
-            # Get full page text for extraction
-            page_text = soup.get_text(separator=' ', strip=True)
-
-            # Get main content for description
-            content = soup.select_one("main, .content, article, #content")
-            description = ""
-            if content:
-                paragraphs = content.select("p")
-                if paragraphs:
-                    description = " ".join(p.get_text(strip=True) for p in paragraphs[:2])
-                    if len(description) > 500:
-                        description = description[:497] + "..."
-
-            # Extract funding amount
+def _is_content(tag: Tag) -> bool:
+    """soup.find() matcher equivalent to select_one("main, .content, article, #content")."""
+    return tag.name in ("main", "article") or "content" in tag.get("class", ()) or tag.get("id") == "content"
+
+
+def _parse(source: Source, body: bytes, scraped_at: str) -> dict:
+    """Build an opportunity from a fetched source page."""
+    # lxml detects the encoding from the bytes (<meta charset>), so skip response.text
+    soup = BeautifulSoup(body, "lxml", parse_only=_STRAINER)
+
+    # Get page title
+    title = soup.find(_is_title)
+    title_text = title.get_text(strip=True) if title else source.name
+
+    # Clean up title from <title> tag
+    title_text = title_text.partition(" | ")[0].partition(" - ")[0]
+
+    # Use known values if provided; only scrape the fields that are missing
+    description = source.known_description
+    funding_size = source.known_amount
+    deadline = source.known_deadline
+    eligibility = source.known_eligibility
+
+    # Get main content for description
+    if not description:
+        description = ""
+        content = soup.find(_is_content)
+        if content:
+            # Walk the first two paragraphs' strings, stopping once past 500 chars
+            texts = []
+            total = 0
+            for p in content.find_all("p", limit=2):
+                parts = []
+                for string in p.stripped_strings:
+                    parts.append(string)
+                    total += len(string)
+                    if total > 500:
+                        break
+                texts.append("".join(parts))
+                total += 1
+                if total > 500:
+                    break
+            description = " ".join(texts)
+            if len(description) > 500:
+                description = description[:497] + "..."
+
+    if not (funding_size and deadline):
+        # Get full page text for extraction
+        page_text = soup.get_text(separator=' ', strip=True)
+
+        # Extract funding amount
+        if not funding_size:
             funding_size = extract_funding_amount(page_text)
 
-            # Try to find deadline patterns
-            deadline = None
-            deadline_patterns = [
-                r"deadline[:\s]+(\w+\s+\d{1,2},?\s+\d{4})",
-                r"applications?\s+due[:\s]+(\w+\s+\d{1,2},?\s+\d{4})",
-                r"closes?[:\s]+(\w+\s+\d{1,2},?\s+\d{4})",
-            ]
-            for pattern in deadline_patterns:
-                match = re.search(pattern, page_text.lower())
+        # Try to find deadline patterns
+        if not deadline:
+            for pattern in _DEADLINE_PATTERNS:
+                match = pattern.search(page_text)
                 if match:
                     deadline = match.group(1).strip()
                     break
 
-            # Use known values if provided, otherwise use scraped values
-            final_description = source.get("known_description") or description
-            final_funding = source.get("known_amount") or funding_size
-            final_eligibility = source.get("known_eligibility")
-
-            opp = {
-                "title": title_text,
-                "url": source["url"],
-                "description": final_description,
-                "source": source["name"],
-                "source_url": source["url"],
-                "type": source["type"],
-                "scraped_at": datetime.utcnow().isoformat(),
-                "deadline": deadline,
-                "funding_size": final_funding,
-            }
-
-            if final_eligibility:
-                opp["eligibility"] = final_eligibility
-
-            # Mark if this should bypass relevance filter
-            if source.get("bypass_filter"):
-                opp["bypass_filter"] = True
-
-            opportunities.append(opp)
-
-        except requests.RequestException as e:
-            print(f"Error scraping {source['name']}: {e}")
-            opportunities.append({
-                "title": source["name"],
-                "url": source["url"],
-                "description": f"Visit {source['url']} for more information.",
-                "source": source["name"],
-                "source_url": source["url"],
-                "type": source["type"],
-                "scraped_at": datetime.utcnow().isoformat(),
-                "deadline": None,
-                "funding_size": None,
-                "scrape_error": str(e),
-            })
-
-    return opportunities
+    opp = {
+        "title": title_text,
+        "url": source.url,
+        "description": description,
+        "source": source.name,
+        "source_url": source.url,
+        "type": source.type,
+        "scraped_at": scraped_at,
+        "deadline": deadline,
+        "funding_size": funding_size,
+    }
+
+    if eligibility:
+        opp["eligibility"] = eligibility
+
+    # Mark if this should bypass relevance filter
+    if source.bypass_filter:
+        opp["bypass_filter"] = True
+
+    return opp
+
+
+def _error_opp(source: Source, error: Exception, scraped_at: str) -> dict:
+    """Placeholder opportunity for a source that couldn't be fetched."""
+    log.warning("Error scraping %s: %s", source.name, error)
+    return {
+        "title": source.name,
+        "url": source.url,
+        "description": f"Visit {source.url} for more information.",
+        "source": source.name,
+        "source_url": source.url,
+        "type": source.type,
+        "scraped_at": scraped_at,
+        "deadline": None,
+        "funding_size": None,
+        "scrape_error": str(error),
+    }
+
+
+def _scrape_one(source: Source, scraped_at: str) -> dict:
+    """Fetch and parse one source, returning a placeholder if the fetch fails."""
+    try:
+        return _parse(source, get_capped(source.url, MAX_PAGE_BYTES, timeout=TIMEOUT), scraped_at)
+    except requests.RequestException as e:
+        return _error_opp(source, e, scraped_at)
+
+
+def scrape() -> List[dict]:
+    """Scrape direct organization pages."""
+    # All records from one run share a single timezone-aware timestamp
+    scraped_at = datetime.now(timezone.utc).isoformat()
+
+    # Each worker fetches and then parses its page, so parsing one page
+    # overlaps with the others' downloads. map() keeps DIRECT_SOURCES order.
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(DIRECT_SOURCES))) as executor:
+        return list(executor.map(lambda source: _scrape_one(source, scraped_at), DIRECT_SOURCES))
@@ -8,14 +8,24 @@ Automatically discovers new sources of journalism fellowships/grants by:
 """
 
 import json
+import mmap
 import re
-import requests
-from bs4 import BeautifulSoup
+import urllib.parse
+from bs4 import BeautifulSoup, SoupStrainer
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import Callable, List, Dict, Optional, Set
 from urllib.parse import urljoin, urlparse
 
+from ._http import get, get_html
+
+try:
+    import orjson
+except ImportError:  # optional speedup; fall back to the stdlib json module
+    orjson = None
+
 # Paths
 SCRIPT_DIR = Path(__file__).parent
 DATA_DIR = SCRIPT_DIR.parent.parent / "data"
@@ -51,27 +61,46 @@ OPPORTUNITY_INDICATORS = [
     "stipend", "funding amount"
 ]
 
+# URLs hardcoded in the scraper source files (matched on raw bytes)
+_URL_RE = re.compile(rb'https?://[^\s"\',\)]+')
+
+# analyze_html only reads <title>, <meta> and the body; skip the rest of <head>
+_ANALYZE_STRAINER = SoupStrainer(["title", "meta", "body"])
+
+# Elements whose text is analyzed, in order of preference
+_CONTENT_ROOTS = ("main", "article", "body")
+
+# A page must mention at least one of these to be considered at all
+RELEVANCE_KEYWORDS = ("journalism", "journalist", "fellowship", "grant", "reporting", "investigative")
+
+# Link text suggesting an aggregator's link points at an opportunity
+OPPORTUNITY_LINK_KEYWORDS = ("fellowship", "grant", "apply", "program", "award")
+
+# Link text worth following when crawling a known aggregator
+CRAWL_LINK_KEYWORDS = ("fellowship", "grant", "funding", "opportunity", "apply", "program")
+
 # Domains to skip (social media, generic sites, etc.)
-SKIP_DOMAINS = {
+SKIP_DOMAINS = frozenset({
     "facebook.com", "twitter.com", "x.com", "linkedin.com", "instagram.com",
     "youtube.com", "tiktok.com", "reddit.com", "pinterest.com",
     "amazon.com", "ebay.com", "wikipedia.org", "wikimedia.org",
     "google.com", "bing.com", "yahoo.com",
     "medium.com",  # Too noisy
-}
+})
 
 # Known good domains (journalism/media focused)
-TRUSTED_DOMAINS = {
+TRUSTED_DOMAINS = frozenset({
     "journalism.org", "nieman.harvard.edu", "pulitzercenter.org",
     "ijnet.org", "gijn.org", "spj.org", "asne.org", "ona.org",
     "poynter.org", "cjr.org", "niemanlab.org", "journalismfund.eu",
     "journalism.co.uk", "fundforjournalism.org", "fij.org"
-}
+})
 
-# Headers for requests
-HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-}
+# Number of candidate pages fetched and analyzed at once
+DISCOVERY_CONCURRENCY = 16
+
+# Candidates declaring a bigger body than this (bytes) are skipped unread
+MAX_ANALYZE_CONTENT_LENGTH = 2_000_000
 
 
 def load_known_sources() -> Set[str]:
@@ -90,10 +119,12 @@ def load_known_sources() -> Set[str]:
         if py_file.name in ["__init__.py", "discovery.py"]:
             continue
         try:
-            content = py_file.read_text()
-            # Extract URLs from the source files
-            urls = re.findall(r'https?://[^\s"\',\)]+', content)
-            known.update(urls)
+            # Extract URLs from the source files, scanning the raw bytes in place
+            with open(py_file, "rb") as f:
+                if py_file.stat().st_size == 0:
+                    continue
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    known.update(m.group().decode("utf-8", "ignore") for m in _URL_RE.finditer(mm))
         except Exception:
             pass
 
@@ -103,18 +134,22 @@ def load_known_sources() -> Set[str]:
 def load_discovered_sources() -> List[Dict]:
     """Load previously discovered sources."""
     if DISCOVERED_SOURCES_FILE.exists():
-        with open(DISCOVERED_SOURCES_FILE) as f:
-            return json.load(f)
+        raw = DISCOVERED_SOURCES_FILE.read_bytes()
+        return orjson.loads(raw) if orjson else json.loads(raw)
     return []
 
 
 def save_discovered_sources(sources: List[Dict]) -> None:
     """Save discovered sources to file."""
     DATA_DIR.mkdir(parents=True, exist_ok=True)
-    with open(DISCOVERED_SOURCES_FILE, "w") as f:
-        json.dump(sources, f, indent=2, default=str)
+    if orjson:
+        data = orjson.dumps(sources, option=orjson.OPT_INDENT_2, default=str)
+    else:
+        data = json.dumps(sources, indent=2, default=str).encode()
+    DISCOVERED_SOURCES_FILE.write_bytes(data)
 
 
+@lru_cache(maxsize=16384)
 def get_domain(url: str) -> str:
     """Extract domain from URL."""
     parsed = urlparse(url)
@@ -126,49 +161,75 @@ def get_domain(url: str) -> str:
 
 
 def should_skip_url(url: str, known_sources: Set[str]) -> bool:
-    """Check if URL should be skipped."""
-    domain = get_domain(url)
+    """Check if URL should be skipped: non-http, a known bad domain, or already known."""
+    return (
+        not url.startswith(("http://", "https://"))
+        or get_domain(url) in SKIP_DOMAINS
+        or url in known_sources
+    )
 
-    # Skip known bad domains
-    if domain in SKIP_DOMAINS:
-        return True
 
-    # Skip if already known
-    if url in known_sources:
-        return True
+def analyze_page(url: str) -> Optional[Dict]:
+    """Fetch a page and analyze it (see analyze_html)."""
+    try:
+        html = get_html(url, max_content_length=MAX_ANALYZE_CONTENT_LENGTH, timeout=15)
+    except Exception:
+        return None
+    # PDFs, binary downloads and huge pages are rejected on their headers
+    if html is None:
+        return None
+    return analyze_html(url, html)
 
-    # Skip non-http URLs
-    if not url.startswith(("http://", "https://")):
-        return True
 
-    return False
+def _map_concurrently(func: Callable[[str], object], items: List[str]) -> list:
+    """Run a network-bound function over URLs/queries in a thread pool, keeping input order."""
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=min(DISCOVERY_CONCURRENCY, len(items))) as executor:
+        return list(executor.map(func, items))
 
 
-def analyze_page(url: str) -> Optional[Dict]:
-    """Analyze a page to determine if it's relevant and what type it is."""
+def analyze_pages(urls: List[str]) -> List[Optional[Dict]]:
+    """Fetch and analyze pages concurrently, returning results in input order."""
+    return _map_concurrently(analyze_page, urls)
+
+
+def analyze_html(url: str, html: bytes) -> Optional[Dict]:
+    """Analyze a page's HTML to determine if it's relevant and what type it is."""
     try:
-        response = requests.get(url, timeout=15, headers=HEADERS)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = BeautifulSoup(html, "lxml", parse_only=_ANALYZE_STRAINER)
+
+        # Collect the title, meta description, content roots and links in one walk
+        title_tag = meta_tag = None
+        roots = {}
+        links = []
+        for tag in soup.find_all(True):
+            name = tag.name
+            if name == "a":
+                if tag.get("href") is not None:
+                    links.append(tag)
+            elif name in _CONTENT_ROOTS:
+                roots.setdefault(name, tag)
+            elif name == "title":
+                if title_tag is None:
+                    title_tag = tag
+            elif name == "meta" and meta_tag is None and tag.get("name") == "description":
+                meta_tag = tag
 
         # Get page text
-        title = soup.title.get_text(strip=True) if soup.title else ""
+        title = title_tag.get_text(strip=True) if title_tag else ""
 
         # Get meta description
-        meta_desc = ""
-        meta_tag = soup.find("meta", attrs={"name": "description"})
-        if meta_tag:
-            meta_desc = meta_tag.get("content", "")
+        meta_desc = meta_tag.get("content", "") if meta_tag else ""
 
         # Get main content text
-        main_content = soup.find("main") or soup.find("article") or soup.find("body")
+        main_content = roots.get("main") or roots.get("article") or roots.get("body")
         page_text = main_content.get_text(separator=" ", strip=True)[:5000] if main_content else ""
 
         combined_text = f"{title} {meta_desc} {page_text}".lower()
 
         # Check relevance - must mention journalism/grants/fellowships
-        relevance_keywords = ["journalism", "journalist", "fellowship", "grant", "reporting", "investigative"]
-        if not any(kw in combined_text for kw in relevance_keywords):
+        if not any(kw in combined_text for kw in RELEVANCE_KEYWORDS):
             return None
 
         # Determine page type
@@ -176,8 +237,8 @@ def analyze_page(url: str) -> Optional[Dict]:
         opportunity_score = sum(1 for ind in OPPORTUNITY_INDICATORS if ind in combined_text)
 
         # Count number of external links (aggregators have more)
-        links = soup.find_all("a", href=True)
-        external_links = [l for l in links if l["href"].startswith("http") and get_domain(l["href"]) != get_domain(url)]
+        domain = get_domain(url)
+        external_links = [l for l in links if l["href"].startswith("http") and get_domain(l["href"]) != domain]
 
         if aggregator_score > opportunity_score and len(external_links) > 5:
             page_type = "aggregator"
@@ -193,12 +254,11 @@ def analyze_page(url: str) -> Optional[Dict]:
                 href = link.get("href", "")
                 link_text = link.get_text(strip=True).lower()
                 # Look for links that seem to be opportunities
-                if any(kw in link_text for kw in ["fellowship", "grant", "apply", "program", "award"]):
+                if any(kw in link_text for kw in OPPORTUNITY_LINK_KEYWORDS):
                     full_url = urljoin(url, href)
                     if not should_skip_url(full_url, set()):
                         opportunity_links.append(full_url)
 
-        domain = get_domain(url)
         trust_score = 10 if domain in TRUSTED_DOMAINS else 5
 
         return {
@@ -227,15 +287,14 @@ def search_web_for_sources(query: str, num_results: int = 10) -> List[str]:
     urls = []
     try:
         search_url = f"https://html.duckduckgo.com/html/?q={query.replace(' ', '+')}"
-        response = requests.get(search_url, headers=HEADERS, timeout=15)
-        soup = BeautifulSoup(response.text, "html.parser")
+        response = get(search_url, timeout=15)
+        soup = BeautifulSoup(response.content, "lxml")
 
         # Find result links
         for result in soup.find_all("a", class_="result__a"):
             href = result.get("href", "")
             # DuckDuckGo wraps URLs, extract the actual URL
             if "uddg=" in href:
-                import urllib.parse
                 parsed = urllib.parse.parse_qs(urllib.parse.urlparse(href).query)
                 if "uddg" in parsed:
                     actual_url = parsed["uddg"][0]
@@ -256,16 +315,15 @@ def crawl_known_source_for_links(url: str) -> List[str]:
     """Crawl a known source to find links to other opportunities/sources."""
     links = []
     try:
-        response = requests.get(url, timeout=15, headers=HEADERS)
-        soup = BeautifulSoup(response.text, "html.parser")
+        response = get(url, timeout=15)
+        soup = BeautifulSoup(response.content, "lxml")
 
         for a_tag in soup.find_all("a", href=True):
             href = a_tag.get("href", "")
             link_text = a_tag.get_text(strip=True).lower()
 
             # Look for relevant-sounding links
-            relevant_terms = ["fellowship", "grant", "funding", "opportunity", "apply", "program"]
-            if any(term in link_text for term in relevant_terms):
+            if any(term in link_text for term in CRAWL_LINK_KEYWORDS):
                 full_url = urljoin(url, href)
                 if full_url.startswith("http"):
                     links.append(full_url)
@@ -287,7 +345,11 @@ def discover_sources(max_new: int = 20) -> List[Dict]:
 
     known_sources = load_known_sources()
     existing_discovered = load_discovered_sources()
-    existing_urls = {s["url"] for s in existing_discovered}
+
+    # One URL-keyed dict serves both candidate filtering and the final dedup:
+    # it starts as the (deduplicated, last entry wins) existing sources and
+    # grows as new ones are kept
+    discovered_by_url = {source["url"]: source for source in existing_discovered}
 
     print(f"Known sources: {len(known_sources)}")
     print(f"Previously discovered: {len(existing_discovered)}")
@@ -297,11 +359,13 @@ def discover_sources(max_new: int = 20) -> List[Dict]:
 
     # 1. Web search for each query
     print("\n[1/3] Searching web for new sources...")
-    for query in DISCOVERY_QUERIES[:5]:  # Limit queries per run
+    queries = DISCOVERY_QUERIES[:5]  # Limit queries per run
+    for query in queries:
         print(f"  Searching: {query}")
-        results = search_web_for_sources(query, num_results=5)
+    # The searches are independent, so run them at once; results keep query order
+    for results in _map_concurrently(lambda query: search_web_for_sources(query, num_results=5), queries):
         for url in results:
-            if not should_skip_url(url, known_sources) and url not in existing_urls:
+            if not should_skip_url(url, known_sources) and url not in discovered_by_url:
                 candidates.add(url)
 
     print(f"  Found {len(candidates)} candidates from search")
@@ -309,11 +373,12 @@ def discover_sources(max_new: int = 20) -> List[Dict]:
     # 2. Crawl existing discovered aggregators for more links
     print("\n[2/3] Crawling known aggregators for links...")
     aggregators = [s for s in existing_discovered if s.get("page_type") == "aggregator"]
-    for agg in aggregators[:3]:  # Limit per run
-        print(f"  Crawling: {agg['url'][:60]}...")
-        links = crawl_known_source_for_links(agg["url"])
+    agg_urls = [agg["url"] for agg in aggregators[:3]]  # Limit per run
+    for agg_url in agg_urls:
+        print(f"  Crawling: {agg_url[:60]}...")
+    for links in _map_concurrently(crawl_known_source_for_links, agg_urls):
         for url in links:
-            if not should_skip_url(url, known_sources) and url not in existing_urls:
+            if not should_skip_url(url, known_sources) and url not in discovered_by_url:
                 candidates.add(url)
 
     print(f"  Total candidates: {len(candidates)}")
@@ -322,36 +387,45 @@ def discover_sources(max_new: int = 20) -> List[Dict]:
     print("\n[3/3] Analyzing candidates...")
     new_discoveries = []
 
-    for url in list(candidates)[:max_new]:
+    # Pages are fetched concurrently; results come back in candidate order
+    to_analyze = list(candidates)[:max_new]
+    for url in to_analyze:
         print(f"  Analyzing: {url[:60]}...")
-        result = analyze_page(url)
-        if result:
-            print(f"    -> {result['page_type']} (trust: {result['trust_score']})")
-            new_discoveries.append(result)
-
-            # If it's an aggregator, also check its opportunity links
-            if result["page_type"] == "aggregator":
-                for opp_url in result.get("opportunity_links", [])[:5]:
-                    if opp_url not in existing_urls and opp_url not in candidates:
-                        opp_result = analyze_page(opp_url)
-                        if opp_result:
-                            new_discoveries.append(opp_result)
-
-    # Merge with existing and save
-    all_discovered = existing_discovered + new_discoveries
-
-    # Deduplicate by URL
-    seen_urls = set()
-    unique_discovered = []
-    for source in all_discovered:
-        if source["url"] not in seen_urls:
-            seen_urls.add(source["url"])
-            unique_discovered.append(source)
+    results = [r for r in analyze_pages(to_analyze) if r]
+    for result in results:
+        print(f"    -> {result['url'][:60]}: {result['page_type']} (trust: {result['trust_score']})")
+
+    # If it's an aggregator, also check its opportunity links (all in one batch)
+    follow_ups = {}
+    for result in results:
+        if result["page_type"] == "aggregator":
+            for opp_url in result.get("opportunity_links", [])[:5]:
+                if opp_url not in discovered_by_url and opp_url not in candidates:
+                    follow_ups[opp_url] = None
+    follow_up_results = dict(zip(follow_ups, analyze_pages(list(follow_ups))))
+
+    # Keep each aggregator's follow-ups right after it, as before
+    for result in results:
+        new_discoveries.append(result)
+        if result["page_type"] == "aggregator":
+            for opp_url in result.get("opportunity_links", [])[:5]:
+                opp_result = follow_up_results.get(opp_url)
+                if opp_result:
+                    new_discoveries.append(opp_result)
+
+    # Merge new sources into the existing ones, deduplicating by URL
+    changed = len(discovered_by_url) != len(existing_discovered)
+    for source in new_discoveries:
+        if source["url"] not in discovered_by_url:
+            discovered_by_url[source["url"]] = source
+            changed = True
 
     # Sort by trust score
-    unique_discovered.sort(key=lambda x: -x.get("trust_score", 0))
+    unique_discovered = sorted(discovered_by_url.values(), key=lambda x: -x.get("trust_score", 0))
 
-    save_discovered_sources(unique_discovered)
+    # The file was saved sorted, so only rewrite it if sources were added or deduplicated
+    if changed:
+        save_discovered_sources(unique_discovered)
 
     print(f"\n{'=' * 60}")
     print(f"Discovery complete!")
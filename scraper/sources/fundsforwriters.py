@@ -1,53 +1,23 @@
 """Scraper for FundsForWriters Grants."""
 
-import requests
-from bs4 import BeautifulSoup
 from typing import List
-from datetime import datetime
+
+from ._generic import SourceConfig, scrape_listings
 
 SOURCE_URL = "https://fundsforwriters.com/grants/"
 SOURCE_NAME = "FundsForWriters"
 
+# FundsForWriters typically uses article/post format
+CONFIG = SourceConfig(
+    name=SOURCE_NAME,
+    url=SOURCE_URL,
+    listing_selector="article, .post, .grant-listing, .entry",
+    title_selector="h2, h3, .entry-title, a",
+    desc_selector="p, .entry-content, .excerpt",
+    type_label="grant",
+)
+
 
 def scrape() -> List[dict]:
     """Scrape FundsForWriters grants page."""
-    opportunities = []
-
-    try:
-        response = requests.get(SOURCE_URL, timeout=30)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        # FundsForWriters typically uses article/post format
-        articles = soup.select("article, .post, .grant-listing, .entry")
-
-        for article in articles:
-            title_elem = article.select_one("h2, h3, .entry-title, a")
-            link_elem = article.select_one("a[href]")
-            desc_elem = article.select_one("p, .entry-content, .excerpt")
-
-            if not title_elem:
-                continue
-
-            title = title_elem.get_text(strip=True)
-            url = link_elem.get("href", "") if link_elem else ""
-            description = desc_elem.get_text(strip=True) if desc_elem else ""
-
-            if not title:
-                continue
-
-            opportunities.append({
-                "title": title,
-                "url": url,
-                "description": description,
-                "source": SOURCE_NAME,
-                "source_url": SOURCE_URL,
-                "type": "grant",
-                "scraped_at": datetime.utcnow().isoformat(),
-                "deadline": None,
-            })
-
-    except requests.RequestException as e:
-        print(f"Error scraping {SOURCE_NAME}: {e}")
-
-    return opportunities
+    return scrape_listings(CONFIG)
@@ -1,15 +1,25 @@
 """Scraper for GFMD Funding Database."""
 
-import re
-import requests
-from bs4 import BeautifulSoup
-from typing import List, Optional
-from datetime import datetime
+from typing import List
+
+from ._generic import SourceConfig, scrape_listings
 
 SOURCE_URL = "https://gfmd.info/fundings/"
 SOURCE_NAME = "GFMD"
 
 
+# Metadata labels in the order GFMD concatenates them, with the result field
+# each one fills (Status isn't kept, but still delimits the Region value)
+_LABELS = (
+    ("Organisation:", "organisation"),
+    ("Region:", "region"),
+    ("Status:", None),
+    ("Deadline:", "deadline"),
+    ("Type:", "funding_type"),
+    ("Funding Size:", "funding_size"),
+)
+
+
 def parse_gfmd_text(raw_text: str) -> dict:
     """Parse GFMD listing text that contains concatenated metadata.
 
@@ -31,87 +41,55 @@ def parse_gfmd_text(raw_text: str) -> dict:
     if "Organisation:" not in raw_text:
         return result
 
-    # Extract title (everything before "Organisation:")
-    title_match = re.match(r'^(.+?)Organisation:', raw_text)
-    if title_match:
-        result["title"] = title_match.group(1).strip()
-
-    # Extract Organisation
-    org_match = re.search(r'Organisation:([^R]+?)(?:Region:|$)', raw_text)
-    if org_match:
-        result["organisation"] = org_match.group(1).strip()
-
-    # Extract Region
-    region_match = re.search(r'Region:([^S]+?)(?:Status:|$)', raw_text)
-    if region_match:
-        result["region"] = region_match.group(1).strip()
-
-    # Extract Deadline
-    deadline_match = re.search(r'Deadline:([^T]+?)(?:Type:|$)', raw_text)
-    if deadline_match:
-        deadline_str = deadline_match.group(1).strip()
-        if deadline_str.lower() != "ongoing":
-            result["deadline"] = deadline_str
-
-    # Extract Type
-    type_match = re.search(r'Type:([^F]+?)(?:Funding Size:|$)', raw_text)
-    if type_match:
-        result["funding_type"] = type_match.group(1).strip()
-
-    # Extract Funding Size
-    size_match = re.search(r'Funding Size:(.+)$', raw_text)
-    if size_match:
-        result["funding_size"] = size_match.group(1).strip()
-
-    return result
-
-
-def scrape() -> List[dict]:
-    """Scrape GFMD funding database."""
-    opportunities = []
+    # Find each label in order; a field's value runs up to the next label found
+    found = []
+    pos = 0
+    for label, field in _LABELS:
+        i = raw_text.find(label, pos)
+        if i != -1:
+            found.append((i, i + len(label), field))
+            pos = i + len(label)
 
-    try:
-        response = requests.get(SOURCE_URL, timeout=30)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+    # Title is everything before the first label
+    result["title"] = raw_text[:found[0][0]].strip()
 
-        # GFMD uses a funding listing structure
-        listings = soup.select(".funding-item, .post, article, .listing")
+    for n, (_, value_start, field) in enumerate(found):
+        value_end = found[n + 1][0] if n + 1 < len(found) else len(raw_text)
+        value = raw_text[value_start:value_end].strip()
+        if field and value:
+            result[field] = value
 
-        for listing in listings:
-            title_elem = listing.select_one("h2, h3, .funding-title, a")
-            link_elem = listing.select_one("a[href]")
+    if result["deadline"] and result["deadline"].lower() == "ongoing":
+        result["deadline"] = None
 
-            if not title_elem:
-                continue
-
-            raw_text = title_elem.get_text(strip=True)
-            url = link_elem.get("href", "") if link_elem else ""
+    return result
 
-            if not raw_text:
-                continue
 
-            # Parse the concatenated text into separate fields
-            parsed = parse_gfmd_text(raw_text)
+def _listing_fields(raw_text: str) -> dict:
+    """Map a GFMD listing's concatenated text onto opportunity fields."""
+    parsed = parse_gfmd_text(raw_text)
+    return {
+        "title": parsed["title"],
+        "type": parsed["funding_type"] or "funding",
+        "deadline": parsed["deadline"],
+        "organisation": parsed["organisation"],
+        "region": parsed["region"],
+        "funding_size": parsed["funding_size"],
+    }
 
-            if not parsed["title"]:
-                continue
 
-            opportunities.append({
-                "title": parsed["title"],
-                "url": url,
-                "description": "",  # Will be filled from individual pages if needed
-                "source": SOURCE_NAME,
-                "source_url": SOURCE_URL,
-                "type": parsed["funding_type"] or "funding",
-                "scraped_at": datetime.utcnow().isoformat(),
-                "deadline": parsed["deadline"],
-                "organisation": parsed["organisation"],
-                "region": parsed["region"],
-                "funding_size": parsed["funding_size"],
-            })
+# GFMD uses a funding listing structure; descriptions would have to come from
+# the individual pages
+CONFIG = SourceConfig(
+    name=SOURCE_NAME,
+    url=SOURCE_URL,
+    listing_selector=".funding-item, .post, article, .listing",
+    title_selector="h2, h3, .funding-title, a",
+    type_label="funding",
+    text_parser=_listing_fields,
+)
 
-    except requests.RequestException as e:
-        print(f"Error scraping {SOURCE_NAME}: {e}")
 
-    return opportunities
+def scrape() -> List[dict]:
+    """Scrape GFMD funding database."""
+    return scrape_listings(CONFIG)
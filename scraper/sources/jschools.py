@@ -1,10 +1,14 @@
 """Scraper for J-school fellowships."""
 
 import re
+import string
 import requests
-from bs4 import BeautifulSoup
-from typing import List, Optional
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from typing import List, Optional, Tuple
+from datetime import datetime, timezone
+
+from ._http import get_capped
 
 # IMPORTANT: known_description and known_eligibility are used as fallbacks when scraping succeeds
 # but returns empty content. These MUST be verified against the actual fellowship websites before
@@ -66,8 +70,82 @@ JSCHOOL_SOURCES = [
     },
 ]
 
+# Pages fetched at once
+MAX_WORKERS = 8
+
+# Stop reading a page after this many bytes; large embedded scripts past
+# this point carry nothing the extractors use
+MAX_PAGE_BYTES = 1024 * 1024
+
+# Characters of page text searched for the amount and deadline before the rest
+HEAD_WINDOW = 4096
+
+# Only build the <title> and <body> subtrees; the rest of <head> (inline
+# scripts, styles, JSON-LD) never reaches the page text
+_STRAINER = SoupStrainer(["title", "body"])
+
+# Layout elements whose text is left out of the page text
+_BOILERPLATE_TAGS = ["nav", "header", "footer", "aside"]
+
+# Title and content classes, as in the selectors these matchers replace
+_TITLE_CLASSES = ("page-title", "entry-title")
+_CONTENT_CLASSES = ("content", "entry-content")
+
+# The funding and deadline patterns are written in lower case and run
+# against a lowered copy of the text, which is much faster than
+# re.IGNORECASE (literal prefixes stay fast-scannable). Captured values are
+# sliced from the original text, so they keep the page's capitalization.
+
+# Patterns to find monetary amounts with context, tried in order; each
+# captures the amount in group 1
+_FUNDING_PATTERNS = [re.compile(p) for p in (
+    # "receives $X" or "award of $X" or "stipend of $X"
+    r'(?:receives?|award(?:ed)?|stipend|grant|fellowship)[^\$€£]*?([\$€£][\d,]+(?:\s*[-–]\s*[\$€£]?[\d,]+)?)',
+    # "$X fellowship/award/grant/stipend"
+    r'([\$€£][\d,]+(?:\s*[-–]\s*[\$€£]?[\d,]+)?)\s*(?:fellowship|award|grant|stipend|prize)',
+    # "up to $X"
+    r'(up to\s*[\$€£][\d,]+)',
+    # "USD/EUR X,XXX"
+    r'((?:usd|eur|gbp)\s*[\d,]+(?:\s*[-–]\s*[\d,]+)?)',
+    # Standalone amounts near keywords
+    r'(?:amount|funding|support|receive)[^\$€£]{0,30}([\$€£][\d,]+(?:\s*[-–]\s*[\$€£]?[\d,]+)?)',
+)]
+
+# Common deadline patterns, tried in order
+_DEADLINE_PATTERNS = [re.compile(p) for p in (
+    r'deadline[:\s]+([a-z][a-z]+\s+\d{1,2},?\s+\d{4})',
+    r'due[:\s]+([a-z][a-z]+\s+\d{1,2},?\s+\d{4})',
+    r'applications?\s+(?:are\s+)?due[:\s]+([a-z][a-z]+\s+\d{1,2},?\s+\d{4})',
+    r'submit\s+by[:\s]+([a-z][a-z]+\s+\d{1,2},?\s+\d{4})',
+)]
+
+# Without a currency symbol on the page only the "USD/EUR X" pattern can
+# match. Skipping the others matters: the first one rescans to the end of the
+# text from every keyword when no amount follows.
+_CURRENCY_SYMBOLS = ("$", "€", "£")
+_CODE_FUNDING_PATTERNS = [p for p in _FUNDING_PATTERNS if "€" not in p.pattern]
+
+# Lowercases ASCII only; used when str.lower() would change the text's length
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_AMOUNT_RE = re.compile(r'[\$€£]([\d,]+)')
 
-def extract_funding_amount(text: str) -> Optional[str]:
+
+def _lowered(text: str) -> str:
+    """Lowercase text without changing its length, so match offsets carry over."""
+    lowered = text.lower()
+    if len(lowered) != len(text):  # e.g. "İ" lowers to two characters
+        lowered = text.translate(_ASCII_LOWER)
+    return lowered
+
+
+def _captured(text: str, match: re.Match) -> str:
+    """Group 1 of a match against the lowered text, taken from the original."""
+    return text[match.start(1):match.end(1)].strip()
+
+
+def _extract_funding_amount(text: str, lowered: str) -> Optional[str]:
     """Extract funding/award amount from text.
 
     Looks for patterns like:
@@ -77,35 +155,21 @@ def extract_funding_amount(text: str) -> Optional[str]:
     - up to $50,000
     - USD 10,000
     """
-    if not text:
-        return None
+    has_symbol = any(symbol in text for symbol in _CURRENCY_SYMBOLS)
 
-    # Patterns to find monetary amounts with context
-    patterns = [
-        # "receives $X" or "award of $X" or "stipend of $X"
-        r'(?:receives?|award(?:ed)?|stipend|grant|fellowship)[^\$€£]*?([\$€£][\d,]+(?:\s*[-–]\s*[\$€£]?[\d,]+)?)',
-        # "$X fellowship/award/grant/stipend"
-        r'([\$€£][\d,]+(?:\s*[-–]\s*[\$€£]?[\d,]+)?)\s*(?:fellowship|award|grant|stipend|prize)',
-        # "up to $X"
-        r'(up to\s*[\$€£][\d,]+)',
-        # "USD/EUR X,XXX"
-        r'((?:USD|EUR|GBP)\s*[\d,]+(?:\s*[-–]\s*[\d,]+)?)',
-        # Standalone amounts near keywords
-        r'(?:amount|funding|support|receive)[^\$€£]{0,30}([\$€£][\d,]+(?:\s*[-–]\s*[\$€£]?[\d,]+)?)',
-    ]
-
-    text_lower = text.lower()
-
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _FUNDING_PATTERNS if has_symbol else _CODE_FUNDING_PATTERNS:
+        match = pattern.search(lowered)
         if match:
-            amount = match.group(1).strip()
+            amount = _captured(text, match)
             # Clean up the amount
-            amount = re.sub(r'\s+', ' ', amount)
+            amount = _WHITESPACE_RE.sub(' ', amount)
             return amount
 
+    if not has_symbol:
+        return None
+
     # Fallback: find any dollar amount that looks significant (over $1000)
-    amounts = re.findall(r'[\$€£]([\d,]+)', text)
+    amounts = _AMOUNT_RE.findall(text)
     for amt in amounts:
         try:
             value = int(amt.replace(',', ''))
@@ -117,104 +181,132 @@ def extract_funding_amount(text: str) -> Optional[str]:
     return None
 
 
-def extract_deadline(text: str) -> Optional[str]:
+def _extract_deadline(text: str, lowered: str) -> Optional[str]:
     """Extract deadline date from text."""
+    for pattern in _DEADLINE_PATTERNS:
+        match = pattern.search(lowered)
+        if match:
+            return _captured(text, match)
+
+    return None
+
+
+def extract_metadata(text: str) -> Tuple[Optional[str], Optional[str]]:
+    """Extract (funding amount, deadline) from page text; either may be None.
+
+    Amounts and deadlines are usually stated near the top of the page, so
+    each is looked for in the first HEAD_WINDOW characters before the rest.
+    """
     if not text:
-        return None
+        return None, None
 
-    # Common deadline patterns
-    patterns = [
-        r'deadline[:\s]+([A-Z][a-z]+\s+\d{1,2},?\s+\d{4})',
-        r'due[:\s]+([A-Z][a-z]+\s+\d{1,2},?\s+\d{4})',
-        r'applications?\s+(?:are\s+)?due[:\s]+([A-Z][a-z]+\s+\d{1,2},?\s+\d{4})',
-        r'submit\s+by[:\s]+([A-Z][a-z]+\s+\d{1,2},?\s+\d{4})',
-    ]
+    lowered = _lowered(text)
+    if len(text) <= HEAD_WINDOW:
+        return _extract_funding_amount(text, lowered), _extract_deadline(text, lowered)
 
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
+    # Cut the window at a space so no amount or date is split in half
+    cut = text.rfind(" ", 0, HEAD_WINDOW) + 1 or HEAD_WINDOW
+    head, head_lowered = text[:cut], lowered[:cut]
+    funding = _extract_funding_amount(head, head_lowered) or _extract_funding_amount(text, lowered)
+    deadline = _extract_deadline(head, head_lowered) or _extract_deadline(text, lowered)
+    return funding, deadline
 
-    return None
+
+def _is_title(tag: Tag) -> bool:
+    """soup.find() matcher equivalent to select_one("h1, .page-title, .entry-title")."""
+    return tag.name == "h1" or any(c in _TITLE_CLASSES for c in tag.get("class", ()))
+
+
+def _is_content(tag: Tag) -> bool:
+    """soup.find() matcher equivalent to select_one("main, .content, article, .entry-content, #content")."""
+    return (tag.name in ("main", "article") or tag.get("id") == "content"
+            or any(c in _CONTENT_CLASSES for c in tag.get("class", ())))
+
+
+def _scrape_one(source: dict, scraped_at: str) -> dict:
+    """Fetch and parse one J-school page, returning a placeholder if the fetch fails."""
+    try:
+        # Read at most MAX_PAGE_BYTES; lxml detects the encoding from the bytes (<meta charset>)
+        body = get_capped(source["url"], MAX_PAGE_BYTES)
+        soup = BeautifulSoup(body, "lxml", parse_only=_STRAINER)
+
+        # Get page title
+        title = soup.find(_is_title)
+        title_text = title.get_text(strip=True) if title else source["name"]
+
+        # Use source name if page title is generic
+        if title_text.lower() in ['home', 'fellowships', 'about', '']:
+            title_text = source["name"]
+
+        # Drop page chrome (menus, banners, sidebars, footers) once the title
+        # is found, so its links and promos don't feed the amount/deadline
+        # patterns. get_text already skips <script> and <style> contents.
+        for tag in soup.find_all(_BOILERPLATE_TAGS):
+            tag.extract()
+
+        # Get full page text for extraction
+        page_text = soup.get_text(separator=' ', strip=True)
+
+        # Get main content for description
+        content = soup.find(_is_content)
+        description = ""
+        if content:
+            paragraphs = content.find_all("p", limit=3)
+            if paragraphs:
+                description = " ".join(p.get_text(strip=True) for p in paragraphs)
+                if len(description) > 500:
+                    description = description[:497] + "..."
+
+        # Extract funding amount and deadline from page, falling back to known values
+        funding_size, deadline = extract_metadata(page_text)
+        funding_size = funding_size or source.get("known_amount")
+        deadline = deadline or source.get("known_deadline")
+
+        # Use known description if scraped one is empty
+        if not description and source.get("known_description"):
+            description = source["known_description"]
+
+        # Get eligibility from known data
+        eligibility = source.get("known_eligibility")
+
+        return {
+            "title": title_text,
+            "url": source["url"],
+            "description": description,
+            "eligibility": eligibility,
+            "source": source["name"],
+            "source_url": source["url"],
+            "type": source["type"],
+            "scraped_at": scraped_at,
+            "deadline": deadline,
+            "funding_size": funding_size,
+        }
+
+    except requests.RequestException as e:
+        print(f"Error scraping {source['name']}: {e}")
+        # When scraping fails, don't use hardcoded descriptions that may be outdated/wrong.
+        # Only include verifiable facts (URL, type) and prompt user to check the source.
+        return {
+            "title": source["name"],
+            "url": source["url"],
+            "description": f"Unable to fetch current information. Visit {source['url']} for details.",
+            "eligibility": None,
+            "source": source["name"],
+            "source_url": source["url"],
+            "type": source["type"],
+            "scraped_at": scraped_at,
+            "deadline": source.get("known_deadline"),
+            "funding_size": source.get("known_amount"),
+            "scrape_error": str(e),
+        }
 
 
 def scrape() -> List[dict]:
     """Scrape J-school fellowship pages."""
-    opportunities = []
-
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
+    # All records from one run share a single timezone-aware timestamp
+    scraped_at = datetime.now(timezone.utc).isoformat()
 
-    for source in JSCHOOL_SOURCES:
-        try:
-            response = requests.get(source["url"], timeout=30, headers=headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Get page title
-            title = soup.select_one("h1, .page-title, .entry-title")
-            title_text = title.get_text(strip=True) if title else source["name"]
-
-            # Use source name if page title is generic
-            if title_text.lower() in ['home', 'fellowships', 'about', '']:
-                title_text = source["name"]
-
-            # Get full page text for extraction
-            page_text = soup.get_text(separator=' ', strip=True)
-
-            # Get main content for description
-            content = soup.select_one("main, .content, article, .entry-content, #content")
-            description = ""
-            if content:
-                paragraphs = content.select("p")
-                if paragraphs:
-                    description = " ".join(p.get_text(strip=True) for p in paragraphs[:3])
-                    if len(description) > 500:
-                        description = description[:497] + "..."
-
-            # Extract funding amount from page, fallback to known amount
-            funding_size = extract_funding_amount(page_text) or source.get("known_amount")
-
-            # Look for deadline information, fallback to known deadline
-            deadline = extract_deadline(page_text) or source.get("known_deadline")
-
-            # Use known description if scraped one is empty
-            if not description and source.get("known_description"):
-                description = source["known_description"]
-
-            # Get eligibility from known data
-            eligibility = source.get("known_eligibility")
-
-            opportunities.append({
-                "title": title_text,
-                "url": source["url"],
-                "description": description,
-                "eligibility": eligibility,
-                "source": source["name"],
-                "source_url": source["url"],
-                "type": source["type"],
-                "scraped_at": datetime.utcnow().isoformat(),
-                "deadline": deadline,
-                "funding_size": funding_size,
-            })
-
-        except requests.RequestException as e:
-            print(f"Error scraping {source['name']}: {e}")
-            # When scraping fails, don't use hardcoded descriptions that may be outdated/wrong.
-            # Only include verifiable facts (URL, type) and prompt user to check the source.
-            opportunities.append({
-                "title": source["name"],
-                "url": source["url"],
-                "description": f"Unable to fetch current information. Visit {source['url']} for details.",
-                "eligibility": None,
-                "source": source["name"],
-                "source_url": source["url"],
-                "type": source["type"],
-                "scraped_at": datetime.utcnow().isoformat(),
-                "deadline": source.get("known_deadline"),
-                "funding_size": source.get("known_amount"),
-                "scrape_error": str(e),
-            })
-
-    return opportunities
+    # The pages are independent and the work is almost all network wait,
+    # so fetch them at once; map() keeps JSCHOOL_SOURCES order
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(JSCHOOL_SOURCES))) as executor:
+        return list(executor.map(lambda source: _scrape_one(source, scraped_at), JSCHOOL_SOURCES))
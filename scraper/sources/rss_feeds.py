@@ -2,7 +2,11 @@
 
 from typing import List
 import feedparser
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from lxml import etree, html
+
+from ._http import get
 
 RSS_FEEDS = [
     {
@@ -12,49 +16,79 @@ RSS_FEEDS = [
     },
 ]
 
+# Feeds fetched at once
+MAX_WORKERS = 8
 
-def scrape() -> List[dict]:
-    """Scrape RSS feeds for opportunities."""
-    opportunities = []
 
-    for feed_info in RSS_FEEDS:
+def _html_to_text(fragment: str) -> str:
+    """Plain text of an HTML fragment, with whitespace collapsed."""
+    # Plain-text summaries need no parse at all
+    if "<" in fragment or "&" in fragment:
         try:
-            feed = feedparser.parse(feed_info["url"])
-
-            for entry in feed.entries:
-                title = entry.get("title", "")
-                url = entry.get("link", "")
-                description = entry.get("summary", entry.get("description", ""))
-
-                # Clean HTML from description
-                if description:
-                    from bs4 import BeautifulSoup
-                    description = BeautifulSoup(description, "html.parser").get_text(strip=True)
-                    # Truncate long descriptions
-                    if len(description) > 500:
-                        description = description[:497] + "..."
-
-                # Get published date
-                published = None
-                if hasattr(entry, "published_parsed") and entry.published_parsed:
-                    published = datetime(*entry.published_parsed[:6]).isoformat()
-
-                if not title:
-                    continue
-
-                opportunities.append({
-                    "title": title,
-                    "url": url,
-                    "description": description,
-                    "source": feed_info["name"],
-                    "source_url": feed_info["url"],
-                    "type": feed_info["type"],
-                    "scraped_at": datetime.utcnow().isoformat(),
-                    "published_at": published,
-                    "deadline": None,
-                })
-
-        except Exception as e:
-            print(f"Error scraping RSS feed {feed_info['name']}: {e}")
+            fragment = html.fromstring(fragment).text_content()
+        except etree.ParserError:  # nothing but comments/whitespace
+            return ""
+    return " ".join(fragment.split())
+
+
+def _scrape_feed(feed_info: dict, scraped_at: str) -> List[dict]:
+    """Fetch one RSS feed and return its entries as opportunities."""
+    opportunities = []
+
+    try:
+        # Fetch through the shared session (pooling, timeout, HTTP cache) and
+        # hand feedparser the bytes, rather than letting it open its own urllib connection
+        response = get(feed_info["url"])
+        response.raise_for_status()
+        feed = feedparser.parse(response.content)
+
+        for entry in feed.entries:
+            title = entry.get("title", "")
+            url = entry.get("link", "")
+            description = entry.get("summary", entry.get("description", ""))
+
+            # Clean HTML from description
+            if description:
+                description = _html_to_text(description)
+                # Truncate long descriptions
+                if len(description) > 500:
+                    description = description[:497] + "..."
+
+            # Get published date
+            published = None
+            if hasattr(entry, "published_parsed") and entry.published_parsed:
+                published = datetime(*entry.published_parsed[:6]).isoformat()
 
+            if not title:
+                continue
+
+            opportunities.append({
+                "title": title,
+                "url": url,
+                "description": description,
+                "source": feed_info["name"],
+                "source_url": feed_info["url"],
+                "type": feed_info["type"],
+                "scraped_at": scraped_at,
+                "published_at": published,
+                "deadline": None,
+            })
+
+    except Exception as e:
+        print(f"Error scraping RSS feed {feed_info['name']}: {e}")
+
+    return opportunities
+
+
+def scrape() -> List[dict]:
+    """Scrape RSS feeds for opportunities."""
+    # All records from one run share a single timezone-aware timestamp
+    scraped_at = datetime.now(timezone.utc).isoformat()
+
+    # feedparser blocks on the download, so fetch the feeds at once;
+    # map() keeps RSS_FEEDS order
+    opportunities = []
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(RSS_FEEDS))) as executor:
+        for feed_opportunities in executor.map(lambda feed_info: _scrape_feed(feed_info, scraped_at), RSS_FEEDS):
+            opportunities.extend(feed_opportunities)
     return opportunities
@@ -1,10 +1,25 @@
 """Deduplication utilities for opportunity matching."""
 
 import re
+from collections import defaultdict
 from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Iterable, Optional
 from urllib.parse import urlparse, urlunparse
 
+try:
+    from rapidfuzz import fuzz
+except ImportError:  # optional speedup; difflib's own bounds are used instead
+    fuzz = None
 
+# Punctuation stripped from titles before comparing them
+_PUNCT_RE = re.compile(r"[^\w\s]")
+
+# Titles at least this similar are treated as the same opportunity
+TITLE_THRESHOLD = 0.9
+
+
+@lru_cache(maxsize=8192)
 def normalize_url(url: str) -> str:
     """Normalize URL for comparison."""
     if not url:
@@ -16,17 +31,62 @@ def normalize_url(url: str) -> str:
     return urlunparse(("", netloc, path, "", "", ""))
 
 
+@lru_cache(maxsize=8192)
+def _norm_title(title: str) -> str:
+    """Lowercase a title and strip its punctuation for comparison."""
+    return _PUNCT_RE.sub("", title.lower())
+
+
 def title_similarity(title1: str, title2: str) -> float:
     """Calculate similarity ratio between two titles."""
     if not title1 or not title2:
         return 0.0
-    # Normalize titles for comparison
-    t1 = re.sub(r"[^\w\s]", "", title1.lower())
-    t2 = re.sub(r"[^\w\s]", "", title2.lower())
-    return SequenceMatcher(None, t1, t2).ratio()
+    return SequenceMatcher(None, _norm_title(title1), _norm_title(title2)).ratio()
+
+
+def _comparable_title(title: str) -> Optional[str]:
+    """Title as title_similarity() compares it, or None if there's no title."""
+    return _norm_title(title) if title else None
+
+
+def _titles_match(title: str, seen: SequenceMatcher) -> bool:
+    """Whether a comparable title reaches TITLE_THRESHOLD similarity with the
+    seen title held as seen's second sequence.
+
+    SequenceMatcher indexes its second sequence (and caches its character
+    counts) when it is set, so keeping one matcher per seen title means each
+    comparison only sets the first sequence instead of re-indexing both.
 
+    Pairs are rejected on cheap upper bounds of ratio() before the full
+    matching-blocks computation: real_quick_ratio() (lengths), then either
+    rapidfuzz's ratio (longest common subsequence, computed in C) or
+    difflib's quick_ratio() (character counts).
+    """
+    seen.set_seq1(title)
+    if seen.real_quick_ratio() < TITLE_THRESHOLD:
+        return False
+    if fuzz is not None:
+        # The matching blocks are a common subsequence, so this is never
+        # below ratio(); the epsilon absorbs float rounding on the percentage
+        if fuzz.ratio(title, seen.b) < TITLE_THRESHOLD * 100 - 1e-6:
+            return False
+    elif seen.quick_ratio() < TITLE_THRESHOLD:
+        return False
+    return seen.ratio() >= TITLE_THRESHOLD
 
-def is_duplicate(opp1: dict, opp2: dict, url_match: bool = True, title_threshold: float = 0.9) -> bool:
+
+def _similar_lengths(length: int) -> range:
+    """Title lengths that could reach TITLE_THRESHOLD against one of this length.
+
+    ratio() can't exceed 2 * shorter / (sum of lengths), so lengths outside
+    [length * T / (2 - T), length * (2 - T) / T] never match. The range is
+    rounded outwards; real_quick_ratio() makes the exact cut.
+    """
+    return range(int(length * TITLE_THRESHOLD / (2 - TITLE_THRESHOLD)),
+                 int(length * (2 - TITLE_THRESHOLD) / TITLE_THRESHOLD) + 2)
+
+
+def is_duplicate(opp1: dict, opp2: dict, url_match: bool = True, title_threshold: float = TITLE_THRESHOLD) -> bool:
     """Check if two opportunities are duplicates."""
     # URL match
     if url_match and opp1.get("url") and opp2.get("url"):
@@ -40,22 +100,47 @@ def is_duplicate(opp1: dict, opp2: dict, url_match: bool = True, title_threshold
     return False
 
 
-def deduplicate(opportunities: list[dict], existing: list[dict] = None) -> list[dict]:
+def deduplicate(opportunities: Iterable[dict], existing: list[dict] = None) -> list[dict]:
     """Remove duplicates from opportunities list, optionally checking against existing."""
     if existing is None:
         existing = []
 
     unique = []
-    all_opps = existing + unique
+
+    # Normalized URLs of everything kept so far, so URL matches are one set
+    # lookup instead of a normalize_url() pair per comparison
+    seen_urls = {normalize_url(o["url"]) for o in existing if o.get("url")}
+
+    # Titles of everything kept so far, normalized once rather than per pair,
+    # each in a matcher that has already indexed it, and bucketed by length
+    # so each title is only compared with titles of a length that could match
+    seen_titles = defaultdict(list)
+
+    def remember_title(title: Optional[str]) -> None:
+        if title is not None:
+            seen_titles[len(title)].append(SequenceMatcher(None, "", title))
+
+    for o in existing:
+        remember_title(_comparable_title(o.get("title", "")))
 
     for opp in opportunities:
-        is_dup = False
-        for existing_opp in all_opps:
-            if is_duplicate(opp, existing_opp):
-                is_dup = True
-                break
-        if not is_dup:
-            unique.append(opp)
-            all_opps.append(opp)
+        url = opp.get("url")
+        url = normalize_url(url) if url else None
+        if url is not None and url in seen_urls:
+            continue
+
+        # No URL match, so only title similarity can make it a duplicate
+        title = _comparable_title(opp.get("title", ""))
+        if title is not None and any(
+            _titles_match(title, seen)
+            for length in _similar_lengths(len(title))
+            for seen in seen_titles.get(length, ())
+        ):
+            continue
+
+        unique.append(opp)
+        if url is not None:
+            seen_urls.add(url)
+        remember_title(title)
 
     return unique
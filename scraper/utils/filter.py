@@ -3,6 +3,8 @@
 from typing import Optional
 import re
 
+from .keywords import KeywordScanner, lowered_fields
+
 # Keywords indicating relevant opportunities for INDIVIDUAL journalists
 RELEVANT_KEYWORDS = [
     "journalism", "journalist", "investigative", "reporting", "reporter",
@@ -12,6 +14,9 @@ RELEVANT_KEYWORDS = [
     "public interest", "accountability", "watchdog"
 ]
 
+# Strong journalism keywords that override an exclusion keyword
+JOURNALISM_KEYWORDS = ["journalism", "journalist", "investigative", "reporting"]
+
 # Keywords indicating irrelevant opportunities (fiction, etc.)
 EXCLUDE_KEYWORDS = [
     "poetry", "poet", "fiction writing", "short story", "novel",
@@ -34,10 +39,10 @@ ORGANIZATION_KEYWORDS = [
 ]
 
 # Exact titles that are too generic (must match exactly after cleaning)
-GENERIC_TITLES = [
+GENERIC_TITLES = frozenset([
     "tipsheet", "grantees", "fellowships", "grants", "awards",
     "opportunities", "resources", "about", "home", "contact"
-]
+])
 
 # Patterns that indicate non-opportunity content
 BAD_TITLE_PATTERNS = [
@@ -45,37 +50,71 @@ BAD_TITLE_PATTERNS = [
 ]
 
 # Types we want to track (for individuals)
-VALID_TYPES = ["fellowship", "grant", "award", "prize", "fund", "scholarship", "funding"]
+VALID_TYPES = ("fellowship", "grant", "award", "prize", "fund", "scholarship", "funding")
 
 # Types to exclude
-EXCLUDE_TYPES = ["newsletter", "article", "blog", "post"]
+EXCLUDE_TYPES = frozenset(["newsletter", "article", "blog", "post"])
+
+# Every keyword list above, scanned for in a single pass over the text
+_SCANNER = KeywordScanner(
+    RELEVANT_KEYWORDS + JOURNALISM_KEYWORDS + EXCLUDE_KEYWORDS + ORGANIZATION_KEYWORDS
+)
+_RELEVANT = frozenset(RELEVANT_KEYWORDS)
+_JOURNALISM = frozenset(JOURNALISM_KEYWORDS)
+_EXCLUDE = frozenset(EXCLUDE_KEYWORDS)
+_ORGANIZATION = frozenset(ORGANIZATION_KEYWORDS)
+
+# Matches a title containing any of BAD_TITLE_PATTERNS
+_BAD_TITLE_RE = re.compile("|".join(map(re.escape, BAD_TITLE_PATTERNS)))
+
+# Matches a type containing any of VALID_TYPES
+_VALID_TYPE_RE = re.compile("|".join(map(re.escape, VALID_TYPES)))
+
+# Common deadline date patterns, tried in order, each with a word it cannot
+# match without; the text is lowered first, so they are case-sensitive
+_DEADLINE_PATTERNS = [(word, re.compile(p)) for word, p in (
+    ("deadline", r"deadline[:\s]+(\w+\s+\d{1,2},?\s+\d{4})"),
+    ("due", r"due[:\s]+(\w+\s+\d{1,2},?\s+\d{4})"),
+    ("close", r"closes?[:\s]+(\w+\s+\d{1,2},?\s+\d{4})"),
+    ("deadline", r"(\w+\s+\d{1,2},?\s+\d{4})\s+deadline"),
+    ("by", r"by\s+(\w+\s+\d{1,2},?\s+\d{4})"),
+)]
+
+# Numbers in a funding size once its thousands separators are removed
+_AMOUNT_RE = re.compile(r"\d+(?:\.\d+)?")
+
+
+def _found(hits: dict[str, int], keywords: frozenset[str], end: Optional[int] = None) -> bool:
+    """Check whether a scan found any of keywords, within text[:end] if given."""
+    if end is None:
+        return not keywords.isdisjoint(hits)
+    return any(hits[keyword] <= end for keyword in keywords.intersection(hits))
 
 
 def is_for_organization(opportunity: dict) -> bool:
     """Check if an opportunity is meant for organizations, not individuals."""
-    title = opportunity.get("title", "").lower()
-    description = opportunity.get("description", "").lower()
+    title, description = lowered_fields(opportunity)
     text = f"{title} {description}"
+    return _is_for_organization(opportunity, _SCANNER.scan(text), len(text))
+
 
+def _is_for_organization(opportunity: dict, hits: dict[str, int], end: int) -> bool:
+    """Organization check on a scan of text beginning "{title} {description}".
+
+    end is the length of that prefix; keywords found only past it are ignored.
+    """
     # Check for organization-focused keywords
-    for keyword in ORGANIZATION_KEYWORDS:
-        if keyword in text:
-            return True
+    if _found(hits, _ORGANIZATION, end):
+        return True
 
     # Check funding size - very large amounts are usually for orgs
     funding_size = opportunity.get("funding_size", "")
     if funding_size:
-        # Extract numeric value
-        import re
-        amounts = re.findall(r'[\d,]+(?:\.\d+)?', funding_size.replace(',', ''))
-        for amount in amounts:
-            try:
-                value = float(amount.replace(',', ''))
-                # Grants over 500k are almost always for organizations
-                if value >= 500000:
-                    return True
-            except ValueError:
-                pass
+        # Extract numeric values; every match is a valid float
+        amounts = _AMOUNT_RE.findall(funding_size.replace(',', ''))
+        # Grants over 500k are almost always for organizations
+        if any(float(amount) >= 500000 for amount in amounts):
+            return True
 
     return False
 
@@ -86,17 +125,16 @@ def is_relevant(opportunity: dict) -> bool:
     if opportunity.get("bypass_filter"):
         return True
 
-    title = opportunity.get("title", "").lower()
-    description = opportunity.get("description", "").lower()
+    title, description = lowered_fields(opportunity)
     opp_type = opportunity.get("type", "").lower()
-    text = f"{title} {description} {opp_type}"
 
     # Exclude newsletter/blog content types
     if opp_type in EXCLUDE_TYPES:
         return False
 
-    # Exclude generic/bad titles
-    title_clean = title.strip().lower().replace("»", "").strip()
+    # Exclude generic/bad titles (title is already lowered, and the final
+    # strip also removes the whitespace around it)
+    title_clean = title.replace("»", "").strip()
     if len(title_clean) < 5:
         return False
 
@@ -105,29 +143,27 @@ def is_relevant(opportunity: dict) -> bool:
         return False
 
     # Check for bad patterns (substrings)
-    for pattern in BAD_TITLE_PATTERNS:
-        if pattern in title_clean:
-            return False
-
-    # Exclude organization-focused opportunities
-    if is_for_organization(opportunity):
+    if _BAD_TITLE_RE.search(title_clean):
         return False
 
-    # Check for exclusion keywords (fiction, poetry, etc.)
-    for keyword in EXCLUDE_KEYWORDS:
-        if keyword in text:
-            # Allow if it also has strong journalism keywords
-            has_journalism = any(k in text for k in ["journalism", "journalist", "investigative", "reporting"])
-            if not has_journalism:
-                return False
+    # One scan of the full text serves every keyword check below
+    text = f"{title} {description} {opp_type}"
+    hits = _SCANNER.scan(text)
 
-    # Check for relevant keywords
-    has_relevant = any(keyword in text for keyword in RELEVANT_KEYWORDS)
+    # Check for exclusion keywords (fiction, poetry, etc.),
+    # allowing them if the text also has strong journalism keywords
+    if _found(hits, _EXCLUDE) and not _found(hits, _JOURNALISM):
+        return False
 
-    # Check for valid type
-    has_valid_type = any(t in opp_type for t in VALID_TYPES)
+    # Exclude organization-focused opportunities (checked after the
+    # exclusion keywords since it may also have to parse the funding size)
+    if _is_for_organization(opportunity, hits, len(title) + 1 + len(description)):
+        return False
 
-    return has_relevant or has_valid_type
+    # Check for valid type or relevant keywords
+    if _VALID_TYPE_RE.search(opp_type):
+        return True
+    return _found(hits, _RELEVANT)
 
 
 def filter_relevant(opportunities: list[dict]) -> list[dict]:
@@ -137,18 +173,14 @@ def filter_relevant(opportunities: list[dict]) -> list[dict]:
 
 def extract_deadline(text: str) -> Optional[str]:
     """Try to extract a deadline date from text."""
-    # Common date patterns
-    patterns = [
-        r"deadline[:\s]+(\w+\s+\d{1,2},?\s+\d{4})",
-        r"due[:\s]+(\w+\s+\d{1,2},?\s+\d{4})",
-        r"closes?[:\s]+(\w+\s+\d{1,2},?\s+\d{4})",
-        r"(\w+\s+\d{1,2},?\s+\d{4})\s+deadline",
-        r"by\s+(\w+\s+\d{1,2},?\s+\d{4})",
-    ]
-
     text_lower = text.lower()
-    for pattern in patterns:
-        match = re.search(pattern, text_lower, re.IGNORECASE)
+    for word, pattern in _DEADLINE_PATTERNS:
+        # Without its word a pattern cannot match; the check is far cheaper
+        # than a search that has to try every position, as the
+        # "<date> deadline" one does
+        if word not in text_lower:
+            continue
+        match = pattern.search(text_lower)
         if match:
             return match.group(1).strip()
 
@@ -0,0 +1,60 @@
+"""Keyword scanning and text preparation shared by the filter and scoring utilities."""
+
+from typing import Iterable
+
+try:
+    import ahocorasick
+except ImportError:  # optional speedup; falls back to one substring search per keyword
+    ahocorasick = None
+
+
+class KeywordScanner:
+    """Find which keywords from a fixed vocabulary occur in a text.
+
+    With pyahocorasick installed the vocabulary is compiled once into an
+    automaton, so a text is traversed a single time however many keywords
+    there are.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = tuple(dict.fromkeys(keywords))
+        self._automaton = None
+        if ahocorasick is not None and self.keywords:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def scan(self, text: str) -> dict[str, int]:
+        """Map each keyword found in text to the end of its first occurrence.
+
+        The end is the index just past the keyword, so a keyword lies within
+        text[:n] exactly when its end is at most n.
+        """
+        hits = {}
+        if self._automaton is not None:
+            for last, keyword in self._automaton.iter(text):
+                hits.setdefault(keyword, last + 1)
+            return hits
+        for keyword in self.keywords:
+            start = text.find(keyword)
+            if start != -1:
+                hits[keyword] = start + len(keyword)
+        return hits
+
+
+def lowered_fields(opportunity: dict) -> tuple[str, str]:
+    """Return the opportunity's lowercased title and description.
+
+    Both the filter and the scoring need them, so they are cached on the
+    opportunity as _lowered; like other underscore fields it is working state
+    that main.py strips before saving.
+    """
+    lowered = opportunity.get("_lowered")
+    if lowered is None:
+        lowered = opportunity["_lowered"] = (
+            opportunity.get("title", "").lower(),
+            opportunity.get("description", "").lower(),
+        )
+    return lowered
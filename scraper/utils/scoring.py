@@ -3,6 +3,8 @@
 import re
 from typing import Optional
 
+from .keywords import KeywordScanner, lowered_fields
+
 # Keywords related to user's interests (higher weight = more relevant)
 INTEREST_KEYWORDS = {
     # Consciousness, meditation, psychedelics (high priority)
@@ -74,6 +76,15 @@ GLOBAL_INDICATORS = [
     "global south",
 ]
 
+# Every keyword and indicator above, scanned for in a single pass over the text
+_SCANNER = KeywordScanner(list(INTEREST_KEYWORDS) + US_INDICATORS + GLOBAL_INDICATORS)
+_US = frozenset(US_INDICATORS)
+_GLOBAL = frozenset(GLOBAL_INDICATORS)
+
+# Each interest keyword's score as (elsewhere, in the title); a keyword in the
+# title gets half its weight again as a bonus (more directly relevant)
+_WEIGHTS = {keyword: (weight, weight + weight // 2) for keyword, weight in INTEREST_KEYWORDS.items()}
+
 
 def calculate_relevance_score(opportunity: dict) -> int:
     """Calculate a relevance score for an opportunity based on user interests.
@@ -83,39 +94,34 @@ def calculate_relevance_score(opportunity: dict) -> int:
     score = 0
 
     # Combine all text fields for keyword matching
-    title = opportunity.get("title", "").lower()
-    description = opportunity.get("description", "").lower()
-    region = opportunity.get("region", "").lower() if opportunity.get("region") else ""
-    org = opportunity.get("organisation", "").lower() if opportunity.get("organisation") else ""
+    title, description = lowered_fields(opportunity)
+    region = (opportunity.get("region") or "").lower()
+    org = (opportunity.get("organisation") or "").lower()
 
     text = f"{title} {description} {org}"
 
-    # Check for interest keywords
-    for keyword, weight in INTEREST_KEYWORDS.items():
-        if keyword in text:
-            score += weight
-            # Bonus if keyword is in title (more directly relevant)
-            if keyword in title:
-                score += weight // 2
+    hits = _SCANNER.scan(text)
+    region_hits = _SCANNER.scan(region) if region else {}
+
+    # Check for interest keywords, with a bonus for those in the title
+    title_end = len(title)
+    for keyword, end in hits.items():
+        weights = _WEIGHTS.get(keyword)
+        if weights is not None:
+            score += weights[end <= title_end]
 
     # US-based boost
-    is_us_based = False
-    for indicator in US_INDICATORS:
-        if indicator in region or indicator in text:
-            is_us_based = True
-            score += 15
-            break
+    is_us_based = not (_US.isdisjoint(region_hits) and _US.isdisjoint(hits))
+    if is_us_based:
+        score += 15
 
     # No region often means US-based or open to US applicants
-    if not region or region.strip() == "":
+    if not region.strip():
         score += 5
 
     # Slight penalty for explicitly non-US focused opportunities
-    if not is_us_based:
-        for indicator in GLOBAL_INDICATORS:
-            if indicator in region:
-                score -= 5
-                break
+    if not is_us_based and not _GLOBAL.isdisjoint(region_hits):
+        score -= 5
 
     # Bonus for having a deadline (more actionable)
     if opportunity.get("deadline"):